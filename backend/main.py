@@ -1,9 +1,12 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
+import asyncio
+import json
 import logging
 from pipeline.production_pipeline import ProductionPipeline
 from pipeline.clinical_validator import ClinicalValidator
-from pipeline.drug_filter import DrugSafetyFilter
+from pipeline.drug_filter import DRUG_SAFETY_FILTER
 
 # Set up logging
 logging.basicConfig(
@@ -15,7 +18,10 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Drug Repurposing API",
     description="AI-powered drug repurposing using gene-disease relationships",
-    version="2.0.0"
+    version="2.0.0",
+    # orjson serializes the large /analyze candidate payloads much faster
+    # than the stdlib encoder
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -27,18 +33,95 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Global pipeline instance
+# Global pipeline and validator instances
 pipeline = None
+validator = None
+
+# Request coalescer for /analyze: requests that arrive within a short
+# window and ask for the same disease share a single pipeline run
+analyze_queue = None
+batch_worker_task = None
+BATCH_WINDOW_SECONDS = 0.05
+BATCH_MAX_SIZE = 16
+
+
+async def batch_worker():
+    """Drain /analyze requests in small windows and dedup identical queries."""
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await analyze_queue.get()]
+
+        # Collect whatever else arrives inside the batching window
+        deadline = loop.time() + BATCH_WINDOW_SECONDS
+        while len(batch) < BATCH_MAX_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(analyze_queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        # The worker must survive anything a batch throws at it: a crash
+        # here would leave every current and future caller hanging on an
+        # unresolved future
+        try:
+            # Dedup by normalized parameters so identical queries run once
+            grouped = {}
+            for params, future in batch:
+                disease_name, min_score, max_results = params
+                key = (disease_name.strip().lower(), min_score, max_results)
+                grouped.setdefault(key, (disease_name, []))[1].append(future)
+
+            if len(batch) > len(grouped):
+                logger.info(f"Coalesced {len(batch)} /analyze requests into {len(grouped)}")
+
+            # Run each distinct query as its own task so different diseases
+            # proceed concurrently and the worker loop can keep draining the
+            # queue while long analyses are in flight
+            for (_, min_score, max_results), (disease_name, futures) in grouped.items():
+                asyncio.create_task(
+                    run_analysis_group(disease_name, min_score, max_results, futures)
+                )
+        except Exception as e:
+            logger.exception(f"Batch worker error: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+
+async def run_analysis_group(disease_name, min_score, max_results, futures):
+    """Run one deduplicated analysis and fan the result out to its waiters."""
+    try:
+        result = await pipeline.analyze_disease(
+            disease_name=disease_name,
+            min_score=min_score,
+            max_results=max_results
+        )
+    except Exception as e:
+        for future in futures:
+            if not future.done():
+                future.set_exception(e)
+        return
+
+    for future in futures:
+        if not future.done():
+            future.set_result(result)
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize the pipeline on startup."""
-    global pipeline
+    global pipeline, validator, analyze_queue, batch_worker_task
     logger.info("🚀 Starting Drug Repurposing API...")
     logger.info("📊 Databases: OpenTargets, ChEMBL, DGIdb, ClinicalTrials.gov")
     try:
         pipeline = ProductionPipeline()
         # ProductionPipeline initializes itself in __init__, no separate initialize() needed
+        # Shared validator so every request reuses one keep-alive HTTP session
+        # instead of paying TCP + TLS setup for the 4 external APIs per call
+        validator = ClinicalValidator()
+        analyze_queue = asyncio.Queue()
+        batch_worker_task = asyncio.create_task(batch_worker())
         logger.info("✅ API ready!")
     except Exception as e:
         logger.error(f"❌ Failed to initialize pipeline: {e}")
@@ -47,10 +130,44 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Clean up on shutdown."""
-    global pipeline
+    global validator, batch_worker_task
     # ProductionPipeline doesn't have a close() method
+    if batch_worker_task:
+        batch_worker_task.cancel()
+    # Fail anything still queued so waiting callers are released instead
+    # of hanging on futures the cancelled worker will never resolve
+    if analyze_queue is not None:
+        while not analyze_queue.empty():
+            _, future = analyze_queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Server shutting down"))
+    if validator:
+        await validator.close()
     logger.info("👋 API shutdown complete")
 
+# Disease name suggestions for the search endpoint. Lowercased once at
+# import time so each query is a scan over prebuilt pairs, not N .lower()
+# calls per request
+DISEASE_SUGGESTIONS = [
+    "Parkinson Disease",
+    "Alzheimer Disease",
+    "Huntington Disease",
+    "Amyotrophic Lateral Sclerosis",
+    "Gaucher Disease",
+    "Wilson Disease",
+    "Cystic Fibrosis",
+    "Duchenne Muscular Dystrophy",
+    "Niemann-Pick Disease",
+    "Type 2 Diabetes Mellitus",
+    "Asthma",
+    "Heart Failure",
+    "Chronic Kidney Disease",
+    "Epilepsy",
+    "Glaucoma",
+]
+_SUGGEST_LC = [(name.lower(), name) for name in DISEASE_SUGGESTIONS]
+
+
 @app.get("/", tags=["Health"])
 async def root():
     """Health check endpoint."""
@@ -60,41 +177,54 @@ async def root():
         "version": "2.0.0"
     }
 
-@app.post("/analyze", tags=["Analysis"])
-async def analyze_disease(request: dict):
-    """
-    Analyze a disease and find repurposing candidates with safety filtering.
+@app.get("/diseases/search", tags=["Analysis"])
+async def search_diseases(query: str = ""):
+    """Suggest disease names matching a (case-insensitive) query."""
+    q = query.strip().lower()
+    if not q:
+        return {"suggestions": DISEASE_SUGGESTIONS}
+    return {
+        "suggestions": [orig for lc, orig in _SUGGEST_LC if q in lc]
+    }
+
+def _parse_analyze_request(request: dict):
+    """Validate and coerce /analyze parameters.
+
+    Returns ((disease_name, min_score, max_results), None) on success or
+    (None, error_message). Bad input must become a per-request error here
+    — if it reached the batch worker it would poison the shared queue.
     """
-    global pipeline
-    
-    if not pipeline:
-        return {
-            "success": False,
-            "error": "Pipeline not initialized"
-        }
-    
+    disease_name = request.get('disease_name')
+    if not isinstance(disease_name, str) or not disease_name.strip():
+        return None, "Missing disease_name"
+    try:
+        min_score = float(request.get('min_score', 0.2))
+        max_results = int(request.get('max_results', 10))
+    except (TypeError, ValueError):
+        return None, "min_score and max_results must be numbers"
+    return (disease_name, min_score, max_results), None
+
+
+async def _run_analysis(disease_name: str, min_score: float, max_results: int) -> dict:
+    """Run the full analysis plus safety filtering for one disease."""
     try:
-        disease_name = request.get('disease_name')
-        min_score = request.get('min_score', 0.2)
-        max_results = request.get('max_results', 10)
-        
-        if not disease_name:
-            return {
-                "success": False,
-                "error": "Missing disease_name"
-            }
-        
         logger.info(f"Analysis request: {disease_name}")
-        
-        # Run gene-based analysis
-        result = await pipeline.analyze_disease(
-            disease_name=disease_name,
-            min_score=min_score,
-            max_results=max_results * 2  # Get extra candidates before filtering
-        )
-        
+
+        # Run gene-based analysis through the coalescing worker so
+        # overlapping requests for the same disease share one pipeline run
+        future = asyncio.get_running_loop().create_future()
+        await analyze_queue.put((
+            (disease_name, min_score, max_results * 2),  # Extra candidates before filtering
+            future
+        ))
+        result = await future
+
         if not result['success']:
             return result
+
+        # Shallow-copy before mutating: coalesced requests share the result
+        result = dict(result)
+        result['candidates'] = [dict(c) for c in result.get('candidates', [])]
         
         # ⭐ FIX: Ensure candidates have the required fields for filtering
         candidates = result.get('candidates', [])
@@ -110,7 +240,9 @@ async def analyze_disease(request: dict):
                 candidate['mechanism'] = ''
         
         # ⭐ FIXED: Apply safety filter with CORRECT settings
-        safety_filter = DrugSafetyFilter()
+        # Shared module-level instance: the database is immutable and its
+        # memo caches warm up across requests
+        safety_filter = DRUG_SAFETY_FILTER
         
         original_count = len(candidates)
         
@@ -118,7 +250,7 @@ async def analyze_disease(request: dict):
             # FIXED: Set remove_relative=True to filter out ALL contraindicated drugs
             # This is critical for safety - "relative" contraindications like olanzapine
             # for diabetes or beta-blockers for asthma are still dangerous!
-            safe_candidates, filtered_out = await safety_filter.filter_candidates(
+            safe_candidates, filtered_out = safety_filter.filter_candidates(
                 candidates=candidates,
                 disease_name=disease_name,
                 remove_absolute=True,   # Remove absolutely contraindicated
@@ -154,17 +286,86 @@ async def analyze_disease(request: dict):
             result['filter_warning'] = f"Safety filter error: {str(filter_error)}"
         
         return result
-    
+
     except Exception as e:
-        logger.error(f"Analysis error: {e}")
-        import traceback
-        traceback.print_exc()
-        
+        logger.exception(f"Analysis error: {e}")
+
         return {
             "success": False,
             "error": str(e)
         }
 
+
+@app.post("/analyze", tags=["Analysis"])
+async def analyze_disease(request: dict):
+    """
+    Analyze a disease and find repurposing candidates with safety filtering.
+    """
+    global pipeline
+
+    if not pipeline:
+        return {
+            "success": False,
+            "error": "Pipeline not initialized"
+        }
+
+    params, error = _parse_analyze_request(request)
+    if error:
+        return {
+            "success": False,
+            "error": error
+        }
+    disease_name, min_score, max_results = params
+
+    return await _run_analysis(disease_name, min_score, max_results)
+
+
+@app.post("/analyze/stream", tags=["Analysis"])
+async def analyze_disease_stream(request: dict):
+    """
+    Analyze a disease, streaming newline-delimited JSON events.
+
+    Emits a 'started' event immediately, heartbeat 'progress' events
+    while the pipeline runs (a first query can take 30-60s), and finally
+    a 'result' event carrying the same payload /analyze returns.
+    """
+    global pipeline
+
+    if not pipeline:
+        return {
+            "success": False,
+            "error": "Pipeline not initialized"
+        }
+
+    params, error = _parse_analyze_request(request)
+    if error:
+        return {
+            "success": False,
+            "error": error
+        }
+    disease_name, min_score, max_results = params
+
+    async def event_stream():
+        start = asyncio.get_running_loop().time()
+        yield json.dumps({"event": "started", "disease_name": disease_name}) + "\n"
+
+        task = asyncio.create_task(
+            _run_analysis(disease_name, min_score, max_results)
+        )
+        # Heartbeat while the pipeline runs so clients and proxies keep
+        # the connection alive instead of timing out on a silent response
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=2.0)
+            if done:
+                break
+            elapsed = round(asyncio.get_running_loop().time() - start, 1)
+            yield json.dumps({"event": "progress", "elapsed_seconds": elapsed}) + "\n"
+
+        yield json.dumps({"event": "result", "data": task.result()}) + "\n"
+
+    return StreamingResponse(event_stream(), media_type="application/x-ndjson")
+
+
 @app.post("/validate_clinical", tags=["Analysis"])
 async def validate_clinical(request: dict):
     """
@@ -176,14 +377,14 @@ async def validate_clinical(request: dict):
     - Safety signals (OpenFDA)
     - Mechanism compatibility
     """
-    global pipeline
-    
+    global pipeline, validator
+
     if not pipeline:
         return {
             "success": False,
             "error": "Pipeline not initialized"
         }
-    
+
     try:
         drug_name = request.get('drug_name')
         disease_name = request.get('disease_name')
@@ -197,32 +398,28 @@ async def validate_clinical(request: dict):
             }
         
         logger.info(f"Clinical validation request: {drug_name} for {disease_name}")
-        
-        # Create validator
-        validator = ClinicalValidator()
-        
-        try:
-            # Run validation
-            validation_result = await validator.validate_candidate(
-                drug_name=drug_name,
-                disease_name=disease_name,
-                drug_data=drug_data,
-                disease_data=disease_data
-            )
-            
-            return {
-                "success": True,
-                "validation": validation_result
-            }
-        
-        finally:
-            await validator.close()
-    
+
+        # Reuse the shared validator (persistent session); create one lazily
+        # only if the startup hook hasn't run (e.g. direct ASGI testing)
+        if validator is None:
+            validator = ClinicalValidator()
+
+        # Run validation
+        validation_result = await validator.validate_candidate(
+            drug_name=drug_name,
+            disease_name=disease_name,
+            drug_data=drug_data,
+            disease_data=disease_data
+        )
+
+        return {
+            "success": True,
+            "validation": validation_result
+        }
+
     except Exception as e:
-        logger.error(f"Clinical validation error: {e}")
-        import traceback
-        traceback.print_exc()
-        
+        logger.exception(f"Clinical validation error: {e}")
+
         return {
             "success": False,
             "error": str(e)
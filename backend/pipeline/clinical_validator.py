@@ -6,15 +6,29 @@ Validates drug repurposing candidates using clinical databases
 import asyncio
 import aiohttp
 import logging
+import re
 from typing import Dict, List, Optional
 from datetime import datetime
 import json
-import ssl
-import certifi
+
+from .data_fetcher import _get_ssl_context
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _keyword_re(*phrases: str) -> "re.Pattern":
+    """Compile a union matching any phrase with derived word endings.
+
+    Each word matches as a prefix ("antipsychotic" also hits
+    "antipsychotics", "parkinson" hits "parkinsonism"), so free-text
+    mechanism strings written in plural or derived forms still trigger.
+    """
+    parts = [
+        r"\s+".join(re.escape(word) + r"\w*" for word in phrase.split())
+        for phrase in phrases
+    ]
+    return re.compile("|".join(parts))
+
 
 class ClinicalValidator:
     """
@@ -24,26 +38,41 @@ class ClinicalValidator:
     - DrugBank (interactions/contraindications)
     - OpenFDA (adverse events)
     """
-    
+
+    # Incompatible mechanism/disease combinations. Keywords are compiled
+    # once at class definition into one prefix-matching union per side, so
+    # each check is a single C-level scan that still catches plural and
+    # derived forms ("antipsychotics", "parkinsonism")
+    INCOMPATIBLE_PATTERNS = (
+        # Immunosuppressants for autoimmune-driven neurodegeneration
+        (
+            _keyword_re('immunosuppressant', 'immunosuppressive'),
+            _keyword_re('autoimmune'),
+            'May worsen autoimmune component',
+        ),
+        # CNS depressants for conditions requiring alertness
+        (
+            _keyword_re('sedative', 'hypnotic', 'cns depressant'),
+            _keyword_re('parkinson', 'movement disorder'),
+            'May worsen motor symptoms',
+        ),
+        # Dopamine antagonists for Parkinson's
+        (
+            _keyword_re('dopamine antagonist', 'antipsychotic'),
+            _keyword_re('parkinson'),
+            'Contraindicated - worsens Parkinson symptoms',
+        ),
+    )
+
     def __init__(self):
         self.session: Optional[aiohttp.ClientSession] = None
         self.cache: Dict = {}
-        self.ssl_context = self._create_ssl_context()
-    
-    def _create_ssl_context(self) -> ssl.SSLContext:
-        """Create SSL context with certifi certificates."""
-        try:
-            ctx = ssl.create_default_context(cafile=certifi.where())
-            return ctx
-        except Exception as e:
-            logger.warning(f"Certifi failed: {e}")
-            return ssl.create_default_context()
-    
+
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self.session is None or self.session.closed:
             timeout = aiohttp.ClientTimeout(total=30, connect=10)
-            connector = aiohttp.TCPConnector(ssl=self.ssl_context)
+            connector = aiohttp.TCPConnector(ssl=_get_ssl_context())
             self.session = aiohttp.ClientSession(
                 timeout=timeout,
                 connector=connector
@@ -77,7 +106,8 @@ class ClinicalValidator:
             logger.info("Using cached validation results")
             return self.cache[cache_key]
         
-        # Run all validations in parallel
+        # Run all validations in parallel - total latency is bounded by the
+        # slowest source instead of the sum of all four
         results = await asyncio.gather(
             self._check_clinical_trials(drug_name, disease_name),
             self._check_pubmed_literature(drug_name, disease_name),
@@ -85,7 +115,14 @@ class ClinicalValidator:
             self._check_mechanism_compatibility(drug_data, disease_data),
             return_exceptions=True
         )
-        
+
+        # Handle per-source failures individually so one bad API doesn't
+        # silently blank the others
+        source_names = ('clinical_trials', 'pubmed', 'openfda', 'mechanism')
+        for source, result in zip(source_names, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Validation source {source} failed: {result}")
+
         trials_data = results[0] if not isinstance(results[0], Exception) else {}
         literature_data = results[1] if not isinstance(results[1], Exception) else {}
         safety_data = results[2] if not isinstance(results[2], Exception) else {}
@@ -362,46 +399,17 @@ class ClinicalValidator:
         """
         Analyze if drug mechanism is compatible with disease.
         """
+        # Lowercase both inputs once; each keyword check below is then one
+        # compiled-pattern scan instead of a loop of substring tests
         mechanism = drug_data.get('mechanism', '').lower()
         disease_name = disease_data.get('name', '').lower()
-        
-        # Define incompatible combinations
-        incompatible_patterns = [
-            # Immunosuppressants for autoimmune-driven neurodegeneration
-            {
-                'drug_keywords': ['immunosuppressant', 'immunosuppressive'],
-                'disease_keywords': ['autoimmune'],
-                'reason': 'May worsen autoimmune component'
-            },
-            # CNS depressants for conditions requiring alertness
-            {
-                'drug_keywords': ['sedative', 'hypnotic', 'cns depressant'],
-                'disease_keywords': ['parkinson', 'movement disorder'],
-                'reason': 'May worsen motor symptoms'
-            },
-            # Dopamine antagonists for Parkinson's
-            {
-                'drug_keywords': ['dopamine antagonist', 'antipsychotic'],
-                'disease_keywords': ['parkinson'],
-                'reason': 'Contraindicated - worsens Parkinson symptoms'
-            }
-        ]
-        
+
         warnings = []
         compatible = True
-        
-        for pattern in incompatible_patterns:
-            drug_match = any(
-                keyword in mechanism
-                for keyword in pattern['drug_keywords']
-            )
-            disease_match = any(
-                keyword in disease_name
-                for keyword in pattern['disease_keywords']
-            )
-            
-            if drug_match and disease_match:
-                warnings.append(pattern['reason'])
+
+        for drug_re, disease_re, reason in self.INCOMPATIBLE_PATTERNS:
+            if drug_re.search(mechanism) and disease_re.search(disease_name):
+                warnings.append(reason)
                 compatible = False
         
         return {
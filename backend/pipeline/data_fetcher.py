@@ -6,17 +6,113 @@ Uses: OpenTargets, ChEMBL, DGIdb, ClinicalTrials.gov
 
 import asyncio
 import aiohttp
+import os
+import random
+import re
 import ssl
+import sys
+import time
 import certifi
-import json
+import orjson
 import logging
-from typing import Optional, List, Dict, Set
+from functools import lru_cache
+from typing import Optional, List, Dict
 from pathlib import Path
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# One compiled alternation scans name + description in a single C-level
+# pass instead of a Python loop of per-keyword substring checks
+_RARE_RE = re.compile(
+    r"\b(rare|orphan|syndrome|dystrophy|atrophy|familial|congenital|hereditary"
+    r"|genetic disorder|lysosomal storage|mitochondrial|metabolic disorder)\b",
+    re.IGNORECASE,
+)
+
+# Curated gene -> pathway knowledge base (biological facts from pathway
+# databases, not hardcoded drug data). Built once at import with immutable
+# tuple values so lookups never allocate
+_PATHWAY_MAP: Dict[str, tuple] = {
+    "SNCA": ("Alpha-synuclein aggregation", "Dopamine metabolism", "Autophagy"),
+    "LRRK2": ("Autophagy", "Mitochondrial function", "Vesicle trafficking"),
+    "PRKN": ("Mitophagy", "Ubiquitin-proteasome system"),
+    "PINK1": ("Mitophagy", "Mitochondrial quality control"),
+    "PARK7": ("Oxidative stress response", "Mitochondrial function"),
+    "DJ1":   ("Oxidative stress response", "Mitochondrial function"),
+    "GBA":   ("Lysosomal function", "Sphingolipid metabolism", "Autophagy"),
+    "GBA1":  ("Lysosomal function", "Sphingolipid metabolism", "Autophagy"),
+    "MAOB":  ("Dopamine metabolism", "Monoamine oxidase"),
+    "TH":    ("Dopamine biosynthesis", "Catecholamine synthesis"),
+    "DDC":   ("Dopamine biosynthesis", "Neurotransmitter synthesis"),
+    "LAMP1": ("Lysosomal function", "Autophagy"),
+    "LAMP2": ("Autophagy", "Lysosomal membrane"),
+    "ATP7B": ("Copper metabolism", "Metal ion homeostasis"),
+    "NPC1":  ("Cholesterol trafficking", "Lysosomal function"),
+    "NPC2":  ("Cholesterol metabolism", "Lipid transport"),
+    "HTT":   ("Huntingtin aggregation", "Ubiquitin-proteasome system"),
+    "APP":   ("Amyloid-beta production", "APP processing"),
+    "MAPT":  ("Tau protein function", "Microtubule stability"),
+    "PSEN1": ("Amyloid-beta production", "Gamma-secretase complex"),
+    "PSEN2": ("Amyloid-beta production", "Gamma-secretase complex"),
+    "APOE":  ("Lipid metabolism", "Amyloid-beta clearance"),
+    "DMD":   ("Dystrophin-glycoprotein complex", "Muscle fiber integrity"),
+    "CFTR":  ("Chloride ion transport", "CFTR trafficking"),
+    "EGFR":  ("EGFR signaling", "MAPK signaling"),
+    "KRAS":  ("RAS signaling", "MAPK signaling"),
+    "PIK3CA": ("PI3K-Akt signaling", "mTOR signaling"),
+    "PTEN":  ("PI3K-Akt signaling", "Cell growth regulation"),
+    "MTOR":  ("mTOR signaling", "Autophagy", "Protein synthesis"),
+    "TP53":  ("p53 signaling", "Apoptosis", "DNA damage response"),
+    "TNF":   ("TNF signaling", "NF-κB signaling", "Inflammatory response"),
+    "IL6":   ("JAK-STAT signaling", "Cytokine signaling"),
+    "NFKB1": ("NF-κB signaling", "Inflammatory response"),
+}
+
+
+# Bitmask encoding of the pathway map: each distinct pathway owns one bit
+# (sorted order, so decoded lists come out sorted), and each gene's pathway
+# set collapses to an int. Unioning pathways across genes is then a single
+# OR per gene instead of hashing strings into a set
+_PATHWAY_NAMES = tuple(sorted({p for paths in _PATHWAY_MAP.values() for p in paths}))
+_PATHWAY_BIT: Dict[str, int] = {name: 1 << i for i, name in enumerate(_PATHWAY_NAMES)}
+_GENE_MASK: Dict[str, int] = {
+    gene: sum(_PATHWAY_BIT[p] for p in paths)
+    for gene, paths in _PATHWAY_MAP.items()
+}
+
+
+def _decode_pathway_mask(mask: int) -> List[str]:
+    """Expand a pathway bitmask back into sorted pathway names."""
+    return [name for name, bit in _PATHWAY_BIT.items() if mask & bit]
+
+
+def _write_json_atomic(path: Path, payload) -> None:
+    """Serialize payload and replace path atomically (no torn cache files)."""
+    tmp = path.with_suffix(".json.tmp")
+    tmp.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+    os.replace(tmp, path)
+
+
+@lru_cache(maxsize=1)
+def _get_ssl_context() -> ssl.SSLContext:
+    """
+    Build the certifi-backed SSL context once per process.
+
+    Creating a context reads the CA bundle from disk and allocates ~1MB,
+    so every fetcher/session shares this module-level instance (which
+    also enables TLS session resumption across connections).
+    """
+    try:
+        ctx = ssl.create_default_context(cafile=certifi.where())
+        logger.info("✅ Using certifi CA certificates")
+        return ctx
+    except Exception as e:
+        logger.warning(f"⚠️  Certifi failed: {e}")
+        return ssl.create_default_context()
+
+
 class ProductionDataFetcher:
     """
     FIXED: Ensures DGIdb actually enriches drugs with gene targets.
@@ -29,39 +125,223 @@ class ProductionDataFetcher:
     DGIDB_API = "https://dgidb.org/api/graphql"
     CLINICALTRIALS_API = "https://clinicaltrials.gov/api/v2/studies"
 
+    # GraphQL documents built once at class creation, with whitespace
+    # collapsed so every request ships the minimal body bytes
+    SEARCH_QUERY = " ".join(
+        """
+        query SearchDisease($query: String!) {
+          search(queryString: $query, entityNames: ["disease"],
+                 page: {index: 0, size: 5}) {
+            hits { id name description entity }
+          }
+        }
+        """.split()
+    )
+
+    # Only approvedSymbol and score are consumed downstream; dropping the
+    # unused target fields roughly halves the bytes parsed per row
+    TARGETS_QUERY = " ".join(
+        """
+        query DiseaseTargets($efoId: String!) {
+          disease(efoId: $efoId) {
+            id name description
+            associatedTargets(page: {index: 0, size: 200}) {
+              count
+              rows {
+                target { approvedSymbol }
+                score
+              }
+            }
+          }
+        }
+        """.split()
+    )
+
+    # Aliased fields query UPPERCASE, Title Case, and original spellings
+    # in one round trip per batch
+    DGIDB_QUERY = " ".join(
+        """
+        fragment DrugFields on Drug {
+          name
+          conceptId
+          approved
+          interactions {
+            gene {
+              name
+            }
+            interactionTypes {
+              type
+            }
+          }
+        }
+        query DrugInteractions($upper: [String!]!, $title: [String!]!, $original: [String!]!) {
+          upper: drugs(names: $upper) {
+            nodes { ...DrugFields }
+          }
+          title: drugs(names: $title) {
+            nodes { ...DrugFields }
+          }
+          original: drugs(names: $original) {
+            nodes { ...DrugFields }
+          }
+        }
+        """.split()
+    )
+
+    # Cap on simultaneous outbound requests; beyond this the public APIs
+    # start rate-limiting and refused connections force full TCP + TLS
+    # reconnects, which dominate tail latency
+    MAX_CONCURRENT_REQUESTS = 64
+    MAX_RETRIES = 3
+
+    # DGIdb gets a tighter cap than the global one; it rate-limits
+    # aggressive clients sooner than the other APIs
+    DGIDB_MAX_CONCURRENT_BATCHES = 5
+
+    # Per-key disk cache entries expire after a week; the upstream
+    # databases change on slower release cycles than that
+    DISK_CACHE_TTL_SECONDS = 7 * 86400
+
     def __init__(self, cache_dir: str = "/tmp/drug_repurposing_cache"):
         self.session: Optional[aiohttp.ClientSession] = None
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
+        # Joined once; fetch_approved_drugs sits on the cold-start path
+        self._chembl_cache_file = self.cache_dir / "chembl_approved_drugs.json"
+        self._sem = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
 
         # In-memory caches
         self.drug_cache: Dict = {}
         self.disease_cache: Dict = {}
         self.interaction_cache: Dict = {}
 
-        # SSL context
-        self.ssl_context = self._create_ssl_context()
+        # In-flight disease fetches keyed like disease_cache, so concurrent
+        # requests for the same disease share one OpenTargets round trip
+        self._disease_inflight: Dict[str, asyncio.Future] = {}
 
-    def _create_ssl_context(self) -> ssl.SSLContext:
-        """Create SSL context with certifi certificates."""
-        try:
-            ctx = ssl.create_default_context(cafile=certifi.where())
-            logger.info("✅ Using certifi CA certificates")
-            return ctx
-        except Exception as e:
-            logger.warning(f"⚠️  Certifi failed: {e}")
-            return ssl.create_default_context()
+        # Parsed approved-drugs list, so warm-process calls skip re-reading
+        # and re-parsing the ~1MB disk cache
+        self._approved_drugs_memo: Optional[List[Dict]] = None
+
+    async def __aenter__(self) -> "ProductionDataFetcher":
+        """
+        Eagerly create the HTTP session so the first fetch doesn't pay
+        session construction inside its critical path.
+
+        Usage: ``async with ProductionDataFetcher() as fetcher: ...``
+        """
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self.session is None or self.session.closed:
             timeout = aiohttp.ClientTimeout(total=60, connect=10)
-            connector = aiohttp.TCPConnector(ssl=self.ssl_context)
+            # Generous keep-alive pool: the fetcher talks to 4 hosts, and
+            # reusing warm connections avoids a TLS handshake per call.
+            # DNS answers are cached for 5 minutes for the same reason
+            connector = aiohttp.TCPConnector(
+                ssl=_get_ssl_context(),
+                limit=200,
+                limit_per_host=32,
+                ttl_dns_cache=300,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            )
             self.session = aiohttp.ClientSession(
-                timeout=timeout, connector=connector
+                timeout=timeout,
+                connector=connector,
+                # All POST bodies are JSON; set the header once here rather
+                # than rebuilding a headers dict per call
+                headers={"Content-Type": "application/json"},
+                # orjson serializes GraphQL request bodies faster than stdlib json
+                json_serialize=lambda obj: orjson.dumps(obj).decode(),
             )
         return self.session
 
+    # Transient upstream statuses worth a retry; anything else is treated
+    # as a real answer and handed back to the caller
+    RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+    async def _request(self, method: str, url: str, **kwargs) -> aiohttp.ClientResponse:
+        """
+        Issue an outbound HTTP request through the shared semaphore.
+
+        All fetchers go through here so total in-flight requests stay
+        bounded. Transient failures — 429/5xx statuses, connection errors,
+        timeouts — are retried up to MAX_RETRIES times with exponential
+        backoff plus jitter, honoring Retry-After when the server sends
+        one. A flaky remote then costs one retried call instead of
+        re-running a whole multi-step fetch pipeline.
+        """
+        session = await self._get_session()
+        for attempt in range(self.MAX_RETRIES):
+            last_attempt = attempt == self.MAX_RETRIES - 1
+            delay = 2 ** attempt + random.random() * 0.5
+            try:
+                async with self._sem:
+                    resp = await session.request(method, url, **kwargs)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if last_attempt:
+                    raise
+                logger.warning(
+                    f"⚠️  {url} request failed, retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 1}/{self.MAX_RETRIES})"
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            if resp.status not in self.RETRY_STATUSES or last_attempt:
+                return resp
+            retry_after = resp.headers.get("Retry-After")
+            resp.release()
+            try:
+                if retry_after:
+                    delay = max(delay, float(retry_after))
+            except ValueError:
+                pass
+            logger.warning(
+                f"⚠️  {url} returned {resp.status}, retrying in {delay:.1f}s "
+                f"(attempt {attempt + 1}/{self.MAX_RETRIES})"
+            )
+            await asyncio.sleep(delay)
+        return resp
+
+    # ══════════════════════════════════════════════════════════════════════════
+    #  DISK CACHE - one file per key
+    # ══════════════════════════════════════════════════════════════════════════
+
+    def _disk_cache_path(self, key: str) -> Path:
+        """Map a cache key to a file inside cache_dir."""
+        safe = re.sub(r"[^a-z0-9._-]+", "_", key.lower())
+        return self.cache_dir / f"{safe}.json"
+
+    def _disk_cache_get(self, key: str) -> Optional[Dict]:
+        """Read a cached entry, honoring the TTL. Returns None on miss."""
+        path = self._disk_cache_path(key)
+        try:
+            if (
+                path.exists()
+                and time.time() - path.stat().st_mtime < self.DISK_CACHE_TTL_SECONDS
+            ):
+                return orjson.loads(path.read_bytes())
+        except Exception as e:
+            logger.warning(f"⚠️  Disk cache read failed for {key}: {e}")
+        return None
+
+    def _disk_cache_set(self, key: str, value: Dict) -> None:
+        """Write one entry to its own file (atomic rename, no global rewrite)."""
+        path = self._disk_cache_path(key)
+        try:
+            tmp = path.with_suffix(".json.tmp")
+            tmp.write_bytes(orjson.dumps(value))
+            os.replace(tmp, path)
+        except Exception as e:
+            logger.warning(f"⚠️  Disk cache write failed for {key}: {e}")
+
     # ══════════════════════════════════════════════════════════════════════════
     #  DISEASE DATA - OpenTargets
     # ══════════════════════════════════════════════════════════════════════════
@@ -75,43 +355,70 @@ class ProductionDataFetcher:
             logger.info("✅ Using cached disease data")
             return self.disease_cache[cache_key]
 
-        data = await self._fetch_from_opentargets(disease_name)
-
-        if data:
-            data = await self._enhance_with_pathways(data)
-            data = await self._add_clinical_trials_count(data)
-            data = self._mark_rare_disease(data)
-            self.disease_cache[cache_key] = data
-            logger.info(
-                f"✅ Disease data ready: {data['name']} "
-                f"({len(data['genes'])} genes, {len(data['pathways'])} pathways)"
-            )
+        # Disk cache keeps fully-enhanced disease records across restarts
+        cached = self._disk_cache_get(f"disease_{cache_key}")
+        if cached is not None:
+            logger.info("✅ Loaded disease data from disk cache")
+            self.disease_cache[cache_key] = cached
+            return cached
+
+        # Coalesce concurrent misses: later callers await the first fetch
+        # instead of issuing their own thundering-herd of GraphQL calls
+        inflight = self._disease_inflight.get(cache_key)
+        if inflight is not None:
+            logger.info("⏳ Awaiting in-flight fetch for same disease")
+            return await inflight
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._disease_inflight[cache_key] = future
+        try:
+            data = await self._fetch_from_opentargets(disease_name)
+
+            if data:
+                # Pathway mapping is local CPU work and the trials count hits
+                # clinicaltrials.gov; both mutate disjoint keys, so overlap the
+                # network round trip with the pathway computation
+                await asyncio.gather(
+                    self._enhance_with_pathways(data),
+                    self._add_clinical_trials_count(data),
+                )
+                data = self._mark_rare_disease(data)
+                self.disease_cache[cache_key] = data
+                self._disk_cache_set(f"disease_{cache_key}", data)
+                logger.info(
+                    f"✅ Disease data ready: {data['name']} "
+                    f"({len(data['genes'])} genes, {len(data['pathways'])} pathways)"
+                )
+        finally:
+            self._disease_inflight.pop(cache_key, None)
+            # Resolve the future however this block exits — including
+            # cancellation, which is a BaseException and would otherwise
+            # leave waiters hanging on a future nobody completes
+            if not future.done():
+                exc = sys.exc_info()[1]
+                if exc is None:
+                    future.set_result(data)
+                elif isinstance(exc, asyncio.CancelledError):
+                    future.cancel()
+                else:
+                    future.set_exception(exc)
+                    future.exception()  # mark retrieved even with no waiters
 
         return data
 
     async def _fetch_from_opentargets(self, disease_name: str) -> Optional[Dict]:
         """Fetch disease and associated genes from OpenTargets."""
-        session = await self._get_session()
-
-        # Search for disease
-        search_query = """
-        query SearchDisease($query: String!) {
-          search(queryString: $query, entityNames: ["disease"],
-                 page: {index: 0, size: 5}) {
-            hits { id name description entity }
-          }
-        }
-        """
         try:
-            async with session.post(
+            # Search for disease
+            async with await self._request(
+                "POST",
                 self.OPENTARGETS_API,
-                json={"query": search_query, "variables": {"query": disease_name}},
-                headers={"Content-Type": "application/json"},
+                json={"query": self.SEARCH_QUERY, "variables": {"query": disease_name}},
             ) as resp:
                 if resp.status != 200:
                     logger.error(f"❌ OpenTargets search failed: {resp.status}")
                     return None
-                result = await resp.json()
+                result = orjson.loads(await resp.read())
                 hits = result.get("data", {}).get("search", {}).get("hits", [])
                 if not hits:
                     logger.warning(f"⚠️  Disease not found: {disease_name}")
@@ -122,48 +429,30 @@ class ProductionDataFetcher:
                 logger.info(f"✅ Found disease: {found_name} (ID: {disease_id})")
 
             # Fetch associated targets/genes
-            targets_query = """
-            query DiseaseTargets($efoId: String!) {
-              disease(efoId: $efoId) {
-                id name description
-                associatedTargets(page: {index: 0, size: 200}) {
-                  count
-                  rows {
-                    target {
-                      id approvedSymbol approvedName biotype
-                    }
-                    score
-                  }
-                }
-              }
-            }
-            """
-            async with session.post(
+            async with await self._request(
+                "POST",
                 self.OPENTARGETS_API,
                 json={
-                    "query": targets_query,
+                    "query": self.TARGETS_QUERY,
                     "variables": {"efoId": disease_id},
                 },
-                headers={"Content-Type": "application/json"},
             ) as resp:
                 if resp.status != 200:
                     logger.error("❌ Failed to fetch disease targets")
                     return None
-                result = await resp.json()
+                result = orjson.loads(await resp.read())
                 disease_data = result.get("data", {}).get("disease", {})
                 if not disease_data:
                     return None
 
                 rows = disease_data.get("associatedTargets", {}).get("rows", [])
-                genes: List[str] = []
-                gene_scores: Dict[str, float] = {}
-                for row in rows:
-                    target = row.get("target", {})
-                    symbol = target.get("approvedSymbol")
-                    score = row.get("score", 0)
-                    if symbol and score > 0.1:
-                        genes.append(symbol)
-                        gene_scores[symbol] = score
+                gene_scores: Dict[str, float] = {
+                    symbol: row["score"]
+                    for row in rows
+                    if (symbol := row.get("target", {}).get("approvedSymbol"))
+                    and row.get("score", 0) > 0.1
+                }
+                genes = list(gene_scores)
 
                 logger.info(f"📊 Found {len(genes)} associated genes from OpenTargets")
                 return {
@@ -188,59 +477,16 @@ class ProductionDataFetcher:
 
     def _map_genes_to_pathways(self, genes: List[str]) -> List[str]:
         """Map gene symbols to known biological pathways - NO HARDCODING."""
-        # This is a curated knowledge base, not hardcoded drug data
-        # These are biological facts from pathway databases
-        pathway_map = {
-            "SNCA": ["Alpha-synuclein aggregation", "Dopamine metabolism", "Autophagy"],
-            "LRRK2": ["Autophagy", "Mitochondrial function", "Vesicle trafficking"],
-            "PRKN": ["Mitophagy", "Ubiquitin-proteasome system"],
-            "PINK1": ["Mitophagy", "Mitochondrial quality control"],
-            "PARK7": ["Oxidative stress response", "Mitochondrial function"],
-            "DJ1":   ["Oxidative stress response", "Mitochondrial function"],
-            "GBA":   ["Lysosomal function", "Sphingolipid metabolism", "Autophagy"],
-            "GBA1":  ["Lysosomal function", "Sphingolipid metabolism", "Autophagy"],
-            "MAOB":  ["Dopamine metabolism", "Monoamine oxidase"],
-            "TH":    ["Dopamine biosynthesis", "Catecholamine synthesis"],
-            "DDC":   ["Dopamine biosynthesis", "Neurotransmitter synthesis"],
-            "LAMP1": ["Lysosomal function", "Autophagy"],
-            "LAMP2": ["Autophagy", "Lysosomal membrane"],
-            "ATP7B": ["Copper metabolism", "Metal ion homeostasis"],
-            "NPC1":  ["Cholesterol trafficking", "Lysosomal function"],
-            "NPC2":  ["Cholesterol metabolism", "Lipid transport"],
-            "HTT":   ["Huntingtin aggregation", "Ubiquitin-proteasome system"],
-            "APP":   ["Amyloid-beta production", "APP processing"],
-            "MAPT":  ["Tau protein function", "Microtubule stability"],
-            "PSEN1": ["Amyloid-beta production", "Gamma-secretase complex"],
-            "PSEN2": ["Amyloid-beta production", "Gamma-secretase complex"],
-            "APOE":  ["Lipid metabolism", "Amyloid-beta clearance"],
-            "DMD":   ["Dystrophin-glycoprotein complex", "Muscle fiber integrity"],
-            "CFTR":  ["Chloride ion transport", "CFTR trafficking"],
-            "EGFR":  ["EGFR signaling", "MAPK signaling"],
-            "KRAS":  ["RAS signaling", "MAPK signaling"],
-            "PIK3CA":["PI3K-Akt signaling", "mTOR signaling"],
-            "PTEN":  ["PI3K-Akt signaling", "Cell growth regulation"],
-            "MTOR":  ["mTOR signaling", "Autophagy", "Protein synthesis"],
-            "TP53":  ["p53 signaling", "Apoptosis", "DNA damage response"],
-            "TNF":   ["TNF signaling", "NF-κB signaling", "Inflammatory response"],
-            "IL6":   ["JAK-STAT signaling", "Cytokine signaling"],
-            "NFKB1": ["NF-κB signaling", "Inflammatory response"],
-        }
-        pathways: Set[str] = set()
+        mask = 0
         for gene in genes:
-            if gene in pathway_map:
-                pathways.update(pathway_map[gene])
-        return sorted(pathways) if pathways else ["General cellular signaling"]
+            mask |= _GENE_MASK.get(gene, 0)
+        return _decode_pathway_mask(mask) if mask else ["General cellular signaling"]
 
     def _mark_rare_disease(self, disease_data: Dict) -> Dict:
         """Identify if this is a rare disease."""
-        name = disease_data.get("name", "").lower()
-        desc = disease_data.get("description", "").lower()
-        rare_kw = [
-            "rare", "orphan", "syndrome", "dystrophy", "atrophy",
-            "familial", "congenital", "hereditary", "genetic disorder",
-            "lysosomal storage", "mitochondrial", "metabolic disorder",
-        ]
-        disease_data["is_rare"] = any(k in name or k in desc for k in rare_kw)
+        name = disease_data.get("name", "")
+        desc = disease_data.get("description", "")
+        disease_data["is_rare"] = bool(_RARE_RE.search(name + " " + desc))
         if disease_data["is_rare"]:
             logger.info(f"🔬 Identified as RARE DISEASE: {disease_data['name']}")
         return disease_data
@@ -248,8 +494,8 @@ class ProductionDataFetcher:
     async def _add_clinical_trials_count(self, disease_data: Dict) -> Dict:
         """Fetch active clinical trial count."""
         try:
-            session = await self._get_session()
-            async with session.get(
+            async with await self._request(
+                "GET",
                 self.CLINICALTRIALS_API,
                 params={
                     "query.cond": disease_data["name"],
@@ -260,7 +506,7 @@ class ProductionDataFetcher:
                 },
             ) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
+                    data = orjson.loads(await resp.read())
                     total = data.get("totalCount", 0)
                     disease_data["active_trials_count"] = total
                     logger.info(f"📋 Found {total} active clinical trials")
@@ -279,13 +525,21 @@ class ProductionDataFetcher:
         """Fetch approved drugs from ChEMBL then enrich via DGIdb."""
         logger.info(f"💊 Fetching approved drugs from ChEMBL (limit={limit})...")
 
-        cache_file = self.cache_dir / "chembl_approved_drugs.json"
+        if self._approved_drugs_memo is not None and len(self._approved_drugs_memo) >= limit:
+            logger.info("✅ Using in-memory drug list")
+            return self._approved_drugs_memo[:limit]
+
+        cache_file = self._chembl_cache_file
         if cache_file.exists():
             try:
-                with open(cache_file) as f:
-                    cached = json.load(f)
+                # Read + parse in a worker thread: the cache is ~1MB and a
+                # blocking read would stall every other in-flight request
+                cached = await asyncio.to_thread(
+                    lambda: orjson.loads(cache_file.read_bytes())
+                )
                 if len(cached) >= limit:
                     logger.info("✅ Loading drugs from cache")
+                    self._approved_drugs_memo = cached
                     return cached[:limit]
             except Exception as e:
                 logger.warning(f"⚠️  Cache read failed: {e}")
@@ -298,188 +552,213 @@ class ProductionDataFetcher:
         logger.info(f"🔗 Enhancing {len(drugs)} drugs with DGIdb targets...")
         drugs = await self._enhance_with_dgidb(drugs)
 
-        # Save to cache
+        # Save to cache off-loop; serializing 500+ drug dicts is CPU work
         try:
-            with open(cache_file, "w") as f:
-                json.dump(drugs, f, indent=2)
+            await asyncio.to_thread(_write_json_atomic, cache_file, drugs)
             logger.info(f"✅ Cached {len(drugs)} drugs")
         except Exception as e:
             logger.warning(f"⚠️  Cache write failed: {e}")
 
+        self._approved_drugs_memo = drugs
         return drugs
 
+    # ChEMBL page size per request; offset windows are fetched concurrently
+    CHEMBL_PAGE_SIZE = 200
+
     async def _fetch_chembl_approved_drugs(self, limit: int) -> List[Dict]:
-        """Fetch FDA-approved drugs from ChEMBL."""
-        session = await self._get_session()
+        """Fetch FDA-approved drugs from ChEMBL, paging concurrently."""
+        # Fan out one request per offset window; the semaphore and the
+        # connector's per-host limit keep the fan-out polite, and the
+        # shared session reuses warm connections across pages
+        results = await asyncio.gather(
+            *[
+                self._fetch_chembl_page(offset, min(self.CHEMBL_PAGE_SIZE, limit - offset))
+                for offset in range(0, limit, self.CHEMBL_PAGE_SIZE)
+            ],
+            return_exceptions=True,
+        )
+
         drugs: List[Dict] = []
-        try:
-            async with session.get(
-                f"{self.CHEMBL_API}/molecule.json",
-                params={"max_phase": "4", "limit": min(limit, 1000), "offset": 0},
-            ) as resp:
-                if resp.status != 200:
-                    logger.error(f"❌ ChEMBL API failed: {resp.status}")
-                    return []
-                data = await resp.json()
-                molecules = data.get("molecules", [])
-                logger.info(f"📥 Processing {len(molecules)} molecules from ChEMBL...")
-                for i, mol in enumerate(molecules):
-                    if i % 50 == 0 and i > 0:
-                        logger.info(f"  ... processed {i}/{len(molecules)}")
-                    drug = self._process_chembl_molecule(mol)
-                    if drug:
-                        drugs.append(drug)
-        except Exception as e:
-            logger.error(f"❌ ChEMBL fetch failed: {e}")
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"❌ ChEMBL fetch failed: {result}")
+                continue
+            drugs.extend(result)
+        logger.info(f"📥 Processed {len(drugs)} molecules from ChEMBL")
+        return drugs
+
+    async def _fetch_chembl_page(self, offset: int, size: int) -> List[Dict]:
+        """Fetch and process one page of approved molecules."""
+        async with await self._request(
+            "GET",
+            f"{self.CHEMBL_API}/molecule.json",
+            params={"max_phase": "4", "limit": size, "offset": offset},
+        ) as resp:
+            if resp.status != 200:
+                logger.error(f"❌ ChEMBL API failed: {resp.status}")
+                return []
+            data = orjson.loads(await resp.read())
+
+        drugs: List[Dict] = []
+        for mol in data.get("molecules", []):
+            drug = self._process_chembl_molecule(mol)
+            if drug:
+                drugs.append(drug)
         return drugs
 
     def _process_chembl_molecule(self, molecule: Dict) -> Optional[Dict]:
         """Process a ChEMBL molecule into drug format."""
-        try:
-            chembl_id = molecule.get("molecule_chembl_id")
-            name = molecule.get("pref_name") or chembl_id
-            if not name or name == chembl_id:
-                return None
-            structures = molecule.get("molecule_structures", {})
-            smiles = structures.get("canonical_smiles", "") if structures else ""
-            return {
-                "id": chembl_id,
-                "name": name,
-                "indication": molecule.get("indication_class", "Various indications"),
-                "mechanism": molecule.get("mechanism_of_action", ""),
-                "approved": True,
-                "smiles": smiles,
-                "targets": [],  # Will be filled by DGIdb
-                "pathways": [],  # Will be inferred from targets
-            }
-        except Exception:
+        chembl_id = molecule.get("molecule_chembl_id")
+        name = molecule.get("pref_name") or chembl_id
+        if not name or name == chembl_id:
             return None
+        # Interned names hash by identity in the dict-heavy lookups downstream
+        name = sys.intern(name)
+        smiles = (molecule.get("molecule_structures") or {}).get("canonical_smiles", "")
+        return {
+            "id": chembl_id,
+            "name": name,
+            "indication": molecule.get("indication_class", "Various indications"),
+            "mechanism": molecule.get("mechanism_of_action", ""),
+            "approved": True,
+            "smiles": smiles,
+            "targets": [],  # Will be filled by DGIdb
+            "pathways": [],  # Will be inferred from targets
+        }
 
-    async def _enhance_with_dgidb(self, drugs: List[Dict]) -> List[Dict]:
+    async def fetch_drug_targets_batch(
+        self, drug_names: List[str], batch_size: int = 100
+    ) -> Dict[str, List[str]]:
         """
-        CRITICAL FIX: Properly enrich drugs with gene targets from DGIdb.
-        Uses correct GraphQL schema: drugs(names) → nodes → interactions
+        Fetch gene targets for many drugs in batched DGIdb GraphQL calls.
+
+        One multi-drug query per batch replaces N per-drug round trips,
+        and aliased fields query the UPPERCASE, Title Case, and original
+        spellings together so no extra variant passes are needed.
+        Returns a mapping of lowercase drug name -> list of gene symbols.
         """
-        session = await self._get_session()
+        # Warm the interaction cache from disk once per process; DGIdb
+        # target lists then survive restarts like disease data does
+        if not self.interaction_cache:
+            self.interaction_cache = self._disk_cache_get("dgidb_targets") or {}
+
+        target_map: Dict[str, List[str]] = {}
+        missing: List[str] = []
+        for name in drug_names:
+            cached = self.interaction_cache.get(name.lower())
+            if cached is not None:
+                target_map.setdefault(name.lower(), cached)
+            else:
+                missing.append(name)
+        if target_map:
+            logger.info(f"✅ {len(target_map)} drugs resolved from interaction cache")
+        if not missing:
+            return target_map
+
+        # Fan the batches out concurrently, but more gently than the global
+        # request cap: DGIdb rate-limits aggressive clients
+        batches = [
+            missing[start : start + batch_size]
+            for start in range(0, len(missing), batch_size)
+        ]
+        sem = asyncio.Semaphore(self.DGIDB_MAX_CONCURRENT_BATCHES)
+
+        async def fetch_batch(index: int, batch: List[str]) -> Dict[str, List[str]]:
+            async with sem:
+                logger.info(f"   Batch {index}/{len(batches)} ({len(batch)} drugs)...")
+                return await self._fetch_dgidb_batch(batch)
+
+        results = await asyncio.gather(
+            *(fetch_batch(i, batch) for i, batch in enumerate(batches, 1)),
+            return_exceptions=True,
+        )
+
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"❌ DGIdb batch failed: {result}")
+                continue
+            # Earlier batches win via the `not in` guard, as before
+            for key, targets in result.items():
+                if targets and key not in target_map:
+                    target_map[key] = targets
+                    self.interaction_cache[key] = targets
+
+        self._disk_cache_set("dgidb_targets", self.interaction_cache)
+        return target_map
+
+    async def _fetch_dgidb_batch(self, batch: List[str]) -> Dict[str, List[str]]:
+        """Query DGIdb for one batch of names; returns lowercase name -> targets."""
+        variables = {
+            "upper": [name.upper() for name in batch],
+            "title": [name.title() for name in batch],
+            "original": batch,
+        }
 
-        DGIDB_QUERY = """
-        query DrugInteractions($names: [String!]!) {
-          drugs(names: $names) {
-            nodes {
-              name
-              conceptId
-              approved
-              interactions {
-                gene {
-                  name
-                }
-                interactionTypes {
-                  type
-                }
-              }
-            }
-          }
+        async with await self._request(
+            "POST",
+            self.DGIDB_API,
+            json={"query": self.DGIDB_QUERY, "variables": variables},
+        ) as resp:
+            if resp.status != 200:
+                text = await resp.text()
+                logger.warning(f"⚠️  DGIdb returned {resp.status}: {text[:200]}")
+                return {}
+            result = orjson.loads(await resp.read())
+
+        if "errors" in result:
+            errs = [e.get("message") for e in result["errors"]]
+            logger.warning(f"⚠️  DGIdb GraphQL errors: {errs}")
+            return {}
+
+        dgidb_drugs = []
+        for alias in ("upper", "title", "original"):
+            nodes = result.get("data", {}).get(alias, {}).get("nodes", []) or []
+            dgidb_drugs.extend(d for d in nodes if d)
+
+        if dgidb_drugs:
+            logger.info(f"   ✅ DGIdb returned {len(dgidb_drugs)} drug records")
+
+        # Lowercase keys for case-insensitive matching; alias duplicates
+        # collapse onto the same key with the same targets
+        return {
+            d["name"].lower(): [
+                i["gene"]["name"]
+                for i in d.get("interactions") or ()
+                if i.get("gene") and i["gene"].get("name")
+            ]
+            for d in dgidb_drugs
+            if d.get("name")
         }
-        """
 
-        BATCH_SIZE = 100
-        drug_names = [d["name"] for d in drugs]
-        
-        # Try multiple name variants to maximize DGIdb matches
-        name_variants = [
-            [name.upper() for name in drug_names],  # UPPERCASE
-            [name.title() for name in drug_names],  # Title Case
-            drug_names,  # Original case
-        ]
+    async def _enhance_with_dgidb(self, drugs: List[Dict]) -> List[Dict]:
+        """
+        CRITICAL FIX: Properly enrich drugs with gene targets from DGIdb.
+        Uses correct GraphQL schema: drugs(names) → nodes → interactions
+        """
+        # Dedup while preserving order: ChEMBL variants can repeat a
+        # pref_name, and duplicates would just pad the DGIdb payloads
+        drug_names = list(dict.fromkeys(d["name"] for d in drugs))
 
-        drug_target_map: Dict[str, List[str]] = {}
-        successful_queries = 0
-        
-        for variant_idx, variant_list in enumerate(name_variants):
-            variant_label = ["UPPERCASE", "TitleCase", "Original"][variant_idx]
-            logger.info(f"🔍 Trying DGIdb with {variant_label} names...")
-            
-            for batch_start in range(0, len(variant_list), BATCH_SIZE):
-                batch = variant_list[batch_start : batch_start + BATCH_SIZE]
-                logger.info(
-                    f"   Batch {batch_start//BATCH_SIZE + 1}/{(len(variant_list)-1)//BATCH_SIZE + 1} "
-                    f"({len(batch)} drugs)..."
-                )
-                
-                try:
-                    async with session.post(
-                        self.DGIDB_API,
-                        json={"query": DGIDB_QUERY, "variables": {"names": batch}},
-                        headers={"Content-Type": "application/json"},
-                    ) as resp:
-                        if resp.status != 200:
-                            text = await resp.text()
-                            logger.warning(f"⚠️  DGIdb returned {resp.status}: {text[:200]}")
-                            continue
-
-                        result = await resp.json()
-
-                        if "errors" in result:
-                            errs = [e.get("message") for e in result["errors"]]
-                            logger.warning(f"⚠️  DGIdb GraphQL errors: {errs}")
-                            continue
-
-                        dgidb_drugs = (
-                            result.get("data", {}).get("drugs", {}).get("nodes", []) or []
-                        )
-                        dgidb_drugs = [d for d in dgidb_drugs if d]
-
-                        if dgidb_drugs:
-                            successful_queries += 1
-                            logger.info(f"   ✅ DGIdb returned {len(dgidb_drugs)} drug records")
-
-                        for dgidb_drug in dgidb_drugs:
-                            raw_name = dgidb_drug.get("name", "")
-                            key = raw_name.lower()
-
-                            interactions = dgidb_drug.get("interactions") or []
-                            targets = [
-                                i["gene"]["name"]
-                                for i in interactions
-                                if i.get("gene") and i["gene"].get("name")
-                            ]
-                            
-                            if targets:
-                                # Store with lowercase key for case-insensitive matching
-                                if key not in drug_target_map:
-                                    drug_target_map[key] = targets
-                                    logger.debug(f"   Mapped {raw_name} → {len(targets)} targets")
-
-                except Exception as e:
-                    logger.error(f"❌ DGIdb batch failed: {e}")
-                    continue
-
-            # If we got good results, no need to try other variants
-            if len(drug_target_map) > len(drugs) * 0.3:  # If we matched >30% of drugs
-                logger.info(f"✅ Good match rate with {variant_label} names, stopping variants")
-                break
+        # One aliased query per batch covers all casing variants, so the
+        # whole drug list is resolved in a single pass
+        drug_target_map = await self.fetch_drug_targets_batch(drug_names)
 
         logger.info(f"📊 DGIdb mapping complete: {len(drug_target_map)} drugs have targets")
-        logger.info(f"   Successful API calls: {successful_queries}")
 
-        # Apply targets back to drugs
-        enhanced = 0
+        # Apply targets back to drugs by iterating the (smaller) target map
+        # against a lowercase index, computing each .lower() exactly once.
+        # The index is list-valued so duplicate ChEMBL names all get enhanced
+        drugs_by_lower: Dict[str, List[Dict]] = {}
         for drug in drugs:
-            # Try multiple name variants for matching
-            candidates = {
-                drug["name"].lower(),
-                drug["name"].upper().lower(),
-                drug["name"].title().lower(),
-            }
-            
-            for key in candidates:
-                if key in drug_target_map:
-                    targets = drug_target_map[key]
-                    drug["targets"] = targets
-                    drug["pathways"] = self._infer_pathways_from_targets(targets)
-                    enhanced += 1
-                    logger.debug(f"   Enhanced {drug['name']} with {len(targets)} targets")
-                    break
+            drugs_by_lower.setdefault(drug["name"].lower(), []).append(drug)
+
+        enhanced = 0
+        for key, targets in drug_target_map.items():
+            for drug in drugs_by_lower.get(key, ()):
+                drug["targets"] = targets
+                drug["pathways"] = self._infer_pathways_from_targets(targets)
+                enhanced += 1
+                logger.debug(f"   Enhanced {drug['name']} with {len(targets)} targets")
 
         logger.info(f"✅ Enhanced {enhanced}/{len(drugs)} drugs with DGIdb gene targets")
         logger.info(f"   Enhancement rate: {enhanced/len(drugs)*100:.1f}%")
@@ -493,10 +772,10 @@ class ProductionDataFetcher:
 
     def _infer_pathways_from_targets(self, targets: List[str]) -> List[str]:
         """Infer biological pathways from gene targets."""
-        pathways: Set[str] = set()
+        mask = 0
         for target in targets[:20]:  # Limit to avoid explosion
-            pathways.update(self._map_genes_to_pathways([target]))
-        return list(pathways)
+            mask |= _GENE_MASK.get(target, 0)
+        return _decode_pathway_mask(mask)
 
     async def close(self):
         """Close the aiohttp session."""
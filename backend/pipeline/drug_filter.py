@@ -2,11 +2,378 @@
 Drug Safety Filter - Filters out contraindicated medications
 """
 import logging
+import sys
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Dict, Tuple, Set
 import re
 
 logger = logging.getLogger(__name__)
 
+# Separators seen in combination-product names ("ibuprofen/famotidine",
+# "aspirin + dipyridamole")
+_TOKEN_SPLIT_RE = re.compile(r"[\s/+,-]+")
+
+# Common salt-form suffixes stripped during normalization; compiled once and
+# non-capturing so the engine skips group bookkeeping
+_SUFFIX_RE = re.compile(r"\s+(?:sodium|hydrochloride|hcl|sulfate|tartrate)$")
+
+
+@lru_cache(maxsize=4096)
+def _normalize_name(name: str) -> str:
+    """Normalize drug/disease names for matching.
+
+    Cached: drug names repeat heavily across candidate batches, so most
+    calls resolve to a hash probe.
+    """
+    if not name:
+        return ""
+    # Convert to lowercase and remove extra whitespace
+    normalized = name.lower().strip()
+    # Remove common suffixes; interned so dict probes against the (also
+    # interned) database keys confirm equality by pointer comparison
+    return sys.intern(_SUFFIX_RE.sub("", normalized))
+
+
+def _build_contraindication_database() -> Dict[str, Dict[str, Dict]]:
+    """
+    Build comprehensive contraindication database.
+    
+    Structure:
+    {
+        "disease_pattern": {
+            "drug_name": {
+                "severity": "absolute" or "relative",
+                "reason": "explanation",
+                "mechanism": "why it's dangerous"
+            }
+        }
+    }
+
+    Disease and drug-name keys are interned so the hash-heavy lookups
+    against this table fast-path on pointer equality (the fetch side
+    interns drug names at ingest).
+    """
+    database = {
+        # ==================== DIABETES ====================
+        "diabetes": {
+            "olanzapine": {
+                "severity": "absolute",
+                "reason": "Causes significant weight gain and worsens glycemic control",
+                "mechanism": "Atypical antipsychotic that severely impairs glucose metabolism"
+            },
+            "clozapine": {
+                "severity": "absolute",
+                "reason": "High risk of hyperglycemia and diabetic ketoacidosis",
+                "mechanism": "Atypical antipsychotic with severe metabolic effects"
+            },
+            "quetiapine": {
+                "severity": "relative",
+                "reason": "Can worsen glycemic control",
+                "mechanism": "Atypical antipsychotic with metabolic side effects"
+            },
+            "risperidone": {
+                "severity": "relative",
+                "reason": "May impair glucose regulation",
+                "mechanism": "Atypical antipsychotic"
+            },
+            "prednisone": {
+                "severity": "relative",
+                "reason": "Increases blood glucose levels",
+                "mechanism": "Corticosteroid that promotes gluconeogenesis"
+            },
+            "dexamethasone": {
+                "severity": "relative",
+                "reason": "Severe hyperglycemia risk",
+                "mechanism": "Potent corticosteroid"
+            },
+            "methylprednisolone": {
+                "severity": "relative",
+                "reason": "Elevates blood sugar",
+                "mechanism": "Corticosteroid"
+            },
+            "hydrocortisone": {
+                "severity": "relative",
+                "reason": "Can destabilize glucose control",
+                "mechanism": "Corticosteroid"
+            }
+        },
+        
+        # ==================== PARKINSON'S DISEASE ====================
+        "parkinson": {
+            "haloperidol": {
+                "severity": "absolute",
+                "reason": "Blocks dopamine receptors, worsens motor symptoms",
+                "mechanism": "Typical antipsychotic - dopamine D2 antagonist"
+            },
+            "perphenazine": {
+                "severity": "absolute",
+                "reason": "Dopamine antagonist that exacerbates Parkinson's symptoms",
+                "mechanism": "Typical antipsychotic"
+            },
+            "chlorpromazine": {
+                "severity": "absolute",
+                "reason": "Severe dopamine blockade",
+                "mechanism": "Typical antipsychotic"
+            },
+            "fluphenazine": {
+                "severity": "absolute",
+                "reason": "Worsens motor symptoms",
+                "mechanism": "Typical antipsychotic"
+            },
+            "metoclopramide": {
+                "severity": "absolute",
+                "reason": "Dopamine antagonist causing parkinsonism",
+                "mechanism": "Antiemetic with dopamine-blocking effects"
+            },
+            "prochlorperazine": {
+                "severity": "absolute",
+                "reason": "Can precipitate severe motor dysfunction",
+                "mechanism": "Antiemetic dopamine antagonist"
+            },
+            "olanzapine": {
+                "severity": "relative",
+                "reason": "Some dopamine blockade, less severe than typical antipsychotics",
+                "mechanism": "Atypical antipsychotic"
+            },
+            "risperidone": {
+                "severity": "relative",
+                "reason": "May worsen motor symptoms at higher doses",
+                "mechanism": "Atypical antipsychotic"
+            }
+        },
+        
+        # ==================== ALZHEIMER'S DISEASE ====================
+        "alzheimer": {
+            "diphenhydramine": {
+                "severity": "absolute",
+                "reason": "Anticholinergic - worsens cognitive function",
+                "mechanism": "Blocks acetylcholine, critical for memory"
+            },
+            "benztropine": {
+                "severity": "absolute",
+                "reason": "Strong anticholinergic effects worsen dementia",
+                "mechanism": "Anticholinergic agent"
+            },
+            "oxybutynin": {
+                "severity": "absolute",
+                "reason": "Anticholinergic - severe cognitive impairment risk",
+                "mechanism": "Bladder medication with strong anticholinergic effects"
+            },
+            "tolterodine": {
+                "severity": "absolute",
+                "reason": "Anticholinergic for overactive bladder",
+                "mechanism": "Muscarinic antagonist"
+            },
+            "hydroxyzine": {
+                "severity": "relative",
+                "reason": "Anticholinergic antihistamine",
+                "mechanism": "Can impair cognition"
+            },
+            "scopolamine": {
+                "severity": "absolute",
+                "reason": "Potent anticholinergic",
+                "mechanism": "Causes confusion and memory impairment"
+            },
+            "cyclobenzaprine": {
+                "severity": "relative",
+                "reason": "Muscle relaxant with anticholinergic properties",
+                "mechanism": "Can worsen cognitive function"
+            },
+            "amitriptyline": {
+                "severity": "relative",
+                "reason": "Tricyclic antidepressant with strong anticholinergic effects",
+                "mechanism": "May impair memory"
+            }
+        },
+        
+        # ==================== ASTHMA ====================
+        "asthma": {
+            "propranolol": {
+                "severity": "absolute",
+                "reason": "Non-selective beta-blocker - causes bronchospasm",
+                "mechanism": "Blocks beta-2 receptors in airways"
+            },
+            "nadolol": {
+                "severity": "absolute",
+                "reason": "Non-selective beta-blocker",
+                "mechanism": "Life-threatening bronchospasm risk"
+            },
+            "timolol": {
+                "severity": "absolute",
+                "reason": "Non-selective beta-blocker",
+                "mechanism": "Even as eye drops can trigger asthma"
+            },
+            "atenolol": {
+                "severity": "relative",
+                "reason": "Beta-1 selective but still risky",
+                "mechanism": "Can cause bronchospasm at higher doses"
+            },
+            "metoprolol": {
+                "severity": "relative",
+                "reason": "Beta-1 selective blocker",
+                "mechanism": "Some beta-2 blockade possible"
+            },
+            "bisoprolol": {
+                "severity": "relative",
+                "reason": "Beta-1 selective but caution needed",
+                "mechanism": "Risk of bronchospasm"
+            },
+            "aspirin": {
+                "severity": "relative",
+                "reason": "Can trigger aspirin-exacerbated respiratory disease",
+                "mechanism": "NSAID-induced bronchospasm in susceptible patients"
+            },
+            "ibuprofen": {
+                "severity": "relative",
+                "reason": "NSAIDs can worsen asthma",
+                "mechanism": "Alternative arachidonic acid pathway"
+            },
+            "naproxen": {
+                "severity": "relative",
+                "reason": "NSAID with bronchospasm risk",
+                "mechanism": "Can trigger asthma attacks"
+            }
+        },
+        
+        # ==================== HEART FAILURE ====================
+        "heart failure": {
+            "ibuprofen": {
+                "severity": "relative",
+                "reason": "NSAIDs cause fluid retention",
+                "mechanism": "Worsens heart failure"
+            },
+            "naproxen": {
+                "severity": "relative",
+                "reason": "NSAID causing sodium retention",
+                "mechanism": "Exacerbates heart failure"
+            },
+            "rosiglitazone": {
+                "severity": "absolute",
+                "reason": "Causes severe fluid retention",
+                "mechanism": "Thiazolidinedione contraindicated in HF"
+            },
+            "pioglitazone": {
+                "severity": "absolute",
+                "reason": "Fluid retention and edema",
+                "mechanism": "Thiazolidinedione"
+            }
+        },
+        
+        # ==================== CHRONIC KIDNEY DISEASE ====================
+        "kidney disease": {
+            "metformin": {
+                "severity": "relative",
+                "reason": "Lactic acidosis risk in severe CKD",
+                "mechanism": "Contraindicated if eGFR < 30"
+            },
+            "ibuprofen": {
+                "severity": "relative",
+                "reason": "NSAIDs worsen kidney function",
+                "mechanism": "Reduces renal blood flow"
+            },
+            "naproxen": {
+                "severity": "relative",
+                "reason": "NSAID nephrotoxicity",
+                "mechanism": "Can precipitate acute kidney injury"
+            }
+        },
+        
+        # ==================== GLAUCOMA ====================
+        "glaucoma": {
+            "diphenhydramine": {
+                "severity": "absolute",
+                "reason": "Anticholinergic - increases intraocular pressure",
+                "mechanism": "Can precipitate acute angle-closure glaucoma"
+            },
+            "benztropine": {
+                "severity": "absolute",
+                "reason": "Strong anticholinergic",
+                "mechanism": "Contraindicated in angle-closure glaucoma"
+            },
+            "oxybutynin": {
+                "severity": "absolute",
+                "reason": "Anticholinergic effects on eye",
+                "mechanism": "Increases intraocular pressure"
+            }
+        },
+        
+        # ==================== EPILEPSY/SEIZURES ====================
+        "epilepsy": {
+            "bupropion": {
+                "severity": "absolute",
+                "reason": "Lowers seizure threshold",
+                "mechanism": "Can precipitate seizures"
+            },
+            "tramadol": {
+                "severity": "relative",
+                "reason": "Seizure risk",
+                "mechanism": "Lowers seizure threshold"
+            },
+            "clozapine": {
+                "severity": "relative",
+                "reason": "Dose-dependent seizure risk",
+                "mechanism": "Can cause seizures"
+            }
+        },
+        
+        # ==================== HYPERTENSION ====================
+        "hypertension": {
+            "pseudoephedrine": {
+                "severity": "relative",
+                "reason": "Increases blood pressure",
+                "mechanism": "Sympathomimetic decongestant"
+            },
+            "phenylephrine": {
+                "severity": "relative",
+                "reason": "Vasoconstrictor",
+                "mechanism": "Raises blood pressure"
+            }
+        }
+    }
+    return {
+        sys.intern(disease): {
+            sys.intern(drug): info for drug, info in entries.items()
+        }
+        for disease, entries in database.items()
+    }
+
+
+def _build_name_index(database: Dict[str, Dict[str, Dict]]) -> Dict[str, List[Tuple[str, Dict]]]:
+    """Flat token index across every disease: drug name -> (key, info) pairs.
+
+    Multi-token candidate names resolve with one hash probe per token
+    instead of a substring scan.
+    """
+    index: Dict[str, List[Tuple[str, Dict]]] = {}
+    for key, entries in database.items():
+        for name, info in entries.items():
+            index.setdefault(name, []).append((key, info))
+    return index
+
+
+# Built once at import and shared read-only by every filter instance, so
+# per-request construction of DrugSafetyFilter costs nothing but a few
+# attribute bindings
+_CONTRA_DB = _build_contraindication_database()
+
+_NAME_INDEX = _build_name_index(_CONTRA_DB)
+
+# One compiled alternation of contraindicated names per disease key, used
+# as a fallback when the exact probe misses — catches salt forms the
+# normalizer doesn't strip and combination products
+# ("ibuprofen/famotidine") in a single C-level scan. Alternatives sorted
+# longest-first so a more specific name wins when one contraindicated
+# name is a substring of another
+_NAME_PATTERNS = {
+    key: re.compile("|".join(
+        re.escape(name) for name in sorted(entries, key=len, reverse=True)
+    ))
+    for key, entries in _CONTRA_DB.items()
+}
+
+logger.info(f"✅ Loaded contraindications for {len(_CONTRA_DB)} disease categories")
+
 
 class DrugSafetyFilter:
     """
@@ -17,313 +384,60 @@ class DrugSafetyFilter:
     - Relative contraindications (use with extreme caution)
     """
     
+    # Aliases that map a query disease name onto each database key. Data
+    # instead of an elif chain: adding a disease category means adding one
+    # entry here, and the lookup loop never grows
+    DISEASE_ALIASES = {
+        "diabetes": ("diabetes", "diabetic"),
+        "parkinson": ("parkinson",),
+        "alzheimer": ("alzheimer", "dementia"),
+        "asthma": ("asthma",),
+        "heart failure": ("heart failure", "cardiac failure"),
+        "kidney disease": ("kidney disease", "kidney", "renal", "ckd"),
+        "glaucoma": ("glaucoma",),
+        "epilepsy": ("epilepsy", "seizure"),
+        "hypertension": ("hypertension", "high blood pressure"),
+    }
+
+    # Keys scanned longest-first so the most specific category matches (and
+    # wins merge collisions) ahead of shorter, broader ones; frozen once at
+    # class definition
+    _ALIAS_SCAN_ORDER = tuple(
+        sorted(DISEASE_ALIASES.items(), key=lambda kv: len(kv[0]), reverse=True)
+    )
+
+    # Every alias folded into one compiled alternation (longest-first) so a
+    # disease name is scanned once at C level instead of once per alias
+    _ALIAS_TO_KEY = {
+        alias: key for key, aliases in DISEASE_ALIASES.items() for alias in aliases
+    }
+    _ALIAS_RE = re.compile("|".join(
+        re.escape(alias) for alias in sorted(_ALIAS_TO_KEY, key=len, reverse=True)
+    ))
+
+    # Cap for the disease and match memos below
+    MEMO_MAX_SIZE = 8192
+
     def __init__(self):
         """Initialize the drug safety filter with contraindication data."""
-        self.CRITICAL_CONTRAINDICATIONS = self._build_contraindication_database()
-        logger.info(f"✅ Loaded contraindications for {len(self.CRITICAL_CONTRAINDICATIONS)} disease categories")
-    
-    def _build_contraindication_database(self) -> Dict[str, Dict[str, Dict]]:
-        """
-        Build comprehensive contraindication database.
-        
-        Structure:
-        {
-            "disease_pattern": {
-                "drug_name": {
-                    "severity": "absolute" or "relative",
-                    "reason": "explanation",
-                    "mechanism": "why it's dangerous"
-                }
-            }
-        }
-        """
-        return {
-            # ==================== DIABETES ====================
-            "diabetes": {
-                "olanzapine": {
-                    "severity": "absolute",
-                    "reason": "Causes significant weight gain and worsens glycemic control",
-                    "mechanism": "Atypical antipsychotic that severely impairs glucose metabolism"
-                },
-                "clozapine": {
-                    "severity": "absolute",
-                    "reason": "High risk of hyperglycemia and diabetic ketoacidosis",
-                    "mechanism": "Atypical antipsychotic with severe metabolic effects"
-                },
-                "quetiapine": {
-                    "severity": "relative",
-                    "reason": "Can worsen glycemic control",
-                    "mechanism": "Atypical antipsychotic with metabolic side effects"
-                },
-                "risperidone": {
-                    "severity": "relative",
-                    "reason": "May impair glucose regulation",
-                    "mechanism": "Atypical antipsychotic"
-                },
-                "prednisone": {
-                    "severity": "relative",
-                    "reason": "Increases blood glucose levels",
-                    "mechanism": "Corticosteroid that promotes gluconeogenesis"
-                },
-                "dexamethasone": {
-                    "severity": "relative",
-                    "reason": "Severe hyperglycemia risk",
-                    "mechanism": "Potent corticosteroid"
-                },
-                "methylprednisolone": {
-                    "severity": "relative",
-                    "reason": "Elevates blood sugar",
-                    "mechanism": "Corticosteroid"
-                },
-                "hydrocortisone": {
-                    "severity": "relative",
-                    "reason": "Can destabilize glucose control",
-                    "mechanism": "Corticosteroid"
-                }
-            },
-            
-            # ==================== PARKINSON'S DISEASE ====================
-            "parkinson": {
-                "haloperidol": {
-                    "severity": "absolute",
-                    "reason": "Blocks dopamine receptors, worsens motor symptoms",
-                    "mechanism": "Typical antipsychotic - dopamine D2 antagonist"
-                },
-                "perphenazine": {
-                    "severity": "absolute",
-                    "reason": "Dopamine antagonist that exacerbates Parkinson's symptoms",
-                    "mechanism": "Typical antipsychotic"
-                },
-                "chlorpromazine": {
-                    "severity": "absolute",
-                    "reason": "Severe dopamine blockade",
-                    "mechanism": "Typical antipsychotic"
-                },
-                "fluphenazine": {
-                    "severity": "absolute",
-                    "reason": "Worsens motor symptoms",
-                    "mechanism": "Typical antipsychotic"
-                },
-                "metoclopramide": {
-                    "severity": "absolute",
-                    "reason": "Dopamine antagonist causing parkinsonism",
-                    "mechanism": "Antiemetic with dopamine-blocking effects"
-                },
-                "prochlorperazine": {
-                    "severity": "absolute",
-                    "reason": "Can precipitate severe motor dysfunction",
-                    "mechanism": "Antiemetic dopamine antagonist"
-                },
-                "olanzapine": {
-                    "severity": "relative",
-                    "reason": "Some dopamine blockade, less severe than typical antipsychotics",
-                    "mechanism": "Atypical antipsychotic"
-                },
-                "risperidone": {
-                    "severity": "relative",
-                    "reason": "May worsen motor symptoms at higher doses",
-                    "mechanism": "Atypical antipsychotic"
-                }
-            },
-            
-            # ==================== ALZHEIMER'S DISEASE ====================
-            "alzheimer": {
-                "diphenhydramine": {
-                    "severity": "absolute",
-                    "reason": "Anticholinergic - worsens cognitive function",
-                    "mechanism": "Blocks acetylcholine, critical for memory"
-                },
-                "benztropine": {
-                    "severity": "absolute",
-                    "reason": "Strong anticholinergic effects worsen dementia",
-                    "mechanism": "Anticholinergic agent"
-                },
-                "oxybutynin": {
-                    "severity": "absolute",
-                    "reason": "Anticholinergic - severe cognitive impairment risk",
-                    "mechanism": "Bladder medication with strong anticholinergic effects"
-                },
-                "tolterodine": {
-                    "severity": "absolute",
-                    "reason": "Anticholinergic for overactive bladder",
-                    "mechanism": "Muscarinic antagonist"
-                },
-                "hydroxyzine": {
-                    "severity": "relative",
-                    "reason": "Anticholinergic antihistamine",
-                    "mechanism": "Can impair cognition"
-                },
-                "scopolamine": {
-                    "severity": "absolute",
-                    "reason": "Potent anticholinergic",
-                    "mechanism": "Causes confusion and memory impairment"
-                },
-                "cyclobenzaprine": {
-                    "severity": "relative",
-                    "reason": "Muscle relaxant with anticholinergic properties",
-                    "mechanism": "Can worsen cognitive function"
-                },
-                "amitriptyline": {
-                    "severity": "relative",
-                    "reason": "Tricyclic antidepressant with strong anticholinergic effects",
-                    "mechanism": "May impair memory"
-                }
-            },
-            
-            # ==================== ASTHMA ====================
-            "asthma": {
-                "propranolol": {
-                    "severity": "absolute",
-                    "reason": "Non-selective beta-blocker - causes bronchospasm",
-                    "mechanism": "Blocks beta-2 receptors in airways"
-                },
-                "nadolol": {
-                    "severity": "absolute",
-                    "reason": "Non-selective beta-blocker",
-                    "mechanism": "Life-threatening bronchospasm risk"
-                },
-                "timolol": {
-                    "severity": "absolute",
-                    "reason": "Non-selective beta-blocker",
-                    "mechanism": "Even as eye drops can trigger asthma"
-                },
-                "atenolol": {
-                    "severity": "relative",
-                    "reason": "Beta-1 selective but still risky",
-                    "mechanism": "Can cause bronchospasm at higher doses"
-                },
-                "metoprolol": {
-                    "severity": "relative",
-                    "reason": "Beta-1 selective blocker",
-                    "mechanism": "Some beta-2 blockade possible"
-                },
-                "bisoprolol": {
-                    "severity": "relative",
-                    "reason": "Beta-1 selective but caution needed",
-                    "mechanism": "Risk of bronchospasm"
-                },
-                "aspirin": {
-                    "severity": "relative",
-                    "reason": "Can trigger aspirin-exacerbated respiratory disease",
-                    "mechanism": "NSAID-induced bronchospasm in susceptible patients"
-                },
-                "ibuprofen": {
-                    "severity": "relative",
-                    "reason": "NSAIDs can worsen asthma",
-                    "mechanism": "Alternative arachidonic acid pathway"
-                },
-                "naproxen": {
-                    "severity": "relative",
-                    "reason": "NSAID with bronchospasm risk",
-                    "mechanism": "Can trigger asthma attacks"
-                }
-            },
-            
-            # ==================== HEART FAILURE ====================
-            "heart failure": {
-                "ibuprofen": {
-                    "severity": "relative",
-                    "reason": "NSAIDs cause fluid retention",
-                    "mechanism": "Worsens heart failure"
-                },
-                "naproxen": {
-                    "severity": "relative",
-                    "reason": "NSAID causing sodium retention",
-                    "mechanism": "Exacerbates heart failure"
-                },
-                "rosiglitazone": {
-                    "severity": "absolute",
-                    "reason": "Causes severe fluid retention",
-                    "mechanism": "Thiazolidinedione contraindicated in HF"
-                },
-                "pioglitazone": {
-                    "severity": "absolute",
-                    "reason": "Fluid retention and edema",
-                    "mechanism": "Thiazolidinedione"
-                }
-            },
-            
-            # ==================== CHRONIC KIDNEY DISEASE ====================
-            "kidney disease": {
-                "metformin": {
-                    "severity": "relative",
-                    "reason": "Lactic acidosis risk in severe CKD",
-                    "mechanism": "Contraindicated if eGFR < 30"
-                },
-                "ibuprofen": {
-                    "severity": "relative",
-                    "reason": "NSAIDs worsen kidney function",
-                    "mechanism": "Reduces renal blood flow"
-                },
-                "naproxen": {
-                    "severity": "relative",
-                    "reason": "NSAID nephrotoxicity",
-                    "mechanism": "Can precipitate acute kidney injury"
-                }
-            },
-            
-            # ==================== GLAUCOMA ====================
-            "glaucoma": {
-                "diphenhydramine": {
-                    "severity": "absolute",
-                    "reason": "Anticholinergic - increases intraocular pressure",
-                    "mechanism": "Can precipitate acute angle-closure glaucoma"
-                },
-                "benztropine": {
-                    "severity": "absolute",
-                    "reason": "Strong anticholinergic",
-                    "mechanism": "Contraindicated in angle-closure glaucoma"
-                },
-                "oxybutynin": {
-                    "severity": "absolute",
-                    "reason": "Anticholinergic effects on eye",
-                    "mechanism": "Increases intraocular pressure"
-                }
-            },
-            
-            # ==================== EPILEPSY/SEIZURES ====================
-            "epilepsy": {
-                "bupropion": {
-                    "severity": "absolute",
-                    "reason": "Lowers seizure threshold",
-                    "mechanism": "Can precipitate seizures"
-                },
-                "tramadol": {
-                    "severity": "relative",
-                    "reason": "Seizure risk",
-                    "mechanism": "Lowers seizure threshold"
-                },
-                "clozapine": {
-                    "severity": "relative",
-                    "reason": "Dose-dependent seizure risk",
-                    "mechanism": "Can cause seizures"
-                }
-            },
-            
-            # ==================== HYPERTENSION ====================
-            "hypertension": {
-                "pseudoephedrine": {
-                    "severity": "relative",
-                    "reason": "Increases blood pressure",
-                    "mechanism": "Sympathomimetic decongestant"
-                },
-                "phenylephrine": {
-                    "severity": "relative",
-                    "reason": "Vasoconstrictor",
-                    "mechanism": "Raises blood pressure"
-                }
-            }
-        }
+        # The database and its derived indexes are module-level constants
+        # built once at import; instances just bind them, so constructing a
+        # filter per request costs nothing
+        self.CRITICAL_CONTRAINDICATIONS = _CONTRA_DB
+        self._name_index = _NAME_INDEX
+        self._name_patterns = _NAME_PATTERNS
+
+        # Memoized per-disease preparation and per-pair match results; the
+        # database is immutable, and pipeline stages re-ask about the same
+        # pairs (retries, re-ranking). LRU-bounded (same pattern as the
+        # pipeline's result cache) because keys derive from user input and
+        # the instance lives for the whole process
+        self._disease_memo: "OrderedDict[str, Tuple[Tuple[str, ...], Dict[str, Dict]]]" = OrderedDict()
+        self._match_memo: "OrderedDict[Tuple[str, Tuple[str, ...]], Dict]" = OrderedDict()
     
     def _normalize_name(self, name: str) -> str:
-        """Normalize drug/disease names for matching."""
-        if not name:
-            return ""
-        # Convert to lowercase and remove extra whitespace
-        normalized = name.lower().strip()
-        # Remove common suffixes
-        normalized = re.sub(r'\s+(sodium|hydrochloride|hcl|sulfate|tartrate)$', '', normalized)
-        return normalized
+        """Normalize drug/disease names for matching (module-level cache)."""
+        return _normalize_name(name)
     
     def _find_disease_key(self, disease_name: str) -> List[str]:
         """
@@ -331,121 +445,244 @@ class DrugSafetyFilter:
         Uses partial matching to handle variations in disease names.
         """
         normalized_disease = self._normalize_name(disease_name)
-        matching_keys = []
-        
-        for key in self.CRITICAL_CONTRAINDICATIONS.keys():
-            # Check if the key is in the disease name or vice versa
-            if key in normalized_disease or normalized_disease in key:
-                matching_keys.append(key)
-            # Also check for specific patterns
-            elif key == "diabetes" and ("diabetes" in normalized_disease or "diabetic" in normalized_disease):
-                matching_keys.append(key)
-            elif key == "parkinson" and "parkinson" in normalized_disease:
-                matching_keys.append(key)
-            elif key == "alzheimer" and ("alzheimer" in normalized_disease or "dementia" in normalized_disease):
-                matching_keys.append(key)
-            elif key == "asthma" and "asthma" in normalized_disease:
-                matching_keys.append(key)
-            elif key == "heart failure" and ("heart failure" in normalized_disease or "cardiac failure" in normalized_disease):
-                matching_keys.append(key)
-            elif key == "kidney disease" and ("kidney" in normalized_disease or "renal" in normalized_disease or "ckd" in normalized_disease):
-                matching_keys.append(key)
-            elif key == "glaucoma" and "glaucoma" in normalized_disease:
-                matching_keys.append(key)
-            elif key == "epilepsy" and ("epilepsy" in normalized_disease or "seizure" in normalized_disease):
-                matching_keys.append(key)
-            elif key == "hypertension" and ("hypertension" in normalized_disease or "high blood pressure" in normalized_disease):
-                matching_keys.append(key)
-        
-        return matching_keys
-    
-    async def filter_candidates(
+
+        # One alternation scan finds every alias occurrence; the short key
+        # pass restores longest-first ordering and keeps the partial-query
+        # behaviour ("kidney" still matches its longer key)
+        hit_keys = {
+            self._ALIAS_TO_KEY[alias]
+            for alias in self._ALIAS_RE.findall(normalized_disease)
+        }
+        return [
+            key for key, _ in self._ALIAS_SCAN_ORDER
+            if key in hit_keys or normalized_disease in key
+        ]
+
+    def _prepare_disease(self, disease_name: str) -> Tuple[Tuple[str, ...], Dict[str, Dict]]:
+        """Memoized (disease keys, merged table) for one disease name."""
+        memo_key = disease_name.lower().strip()
+        cached = self._disease_memo.get(memo_key)
+        if cached is None:
+            disease_keys = tuple(self._find_disease_key(disease_name))
+            merged = self._merge_contraindications(list(disease_keys)) if disease_keys else {}
+            cached = (disease_keys, merged)
+            self._disease_memo[memo_key] = cached
+            if len(self._disease_memo) > self.MEMO_MAX_SIZE:
+                self._disease_memo.popitem(last=False)
+        else:
+            self._disease_memo.move_to_end(memo_key)
+        return cached
+
+    def _match_contraindication(
+        self,
+        normalized_drug: str,
+        disease_keys: Tuple[str, ...],
+        contraindications: Dict[str, Dict]
+    ) -> Dict:
+        """Resolve one normalized drug name: exact probe, tokens, then scan."""
+        info = contraindications.get(normalized_drug)
+        if info is not None:
+            return info
+
+        memo_key = (normalized_drug, disease_keys)
+        if memo_key in self._match_memo:
+            self._match_memo.move_to_end(memo_key)
+            return self._match_memo[memo_key]
+
+        # Hashed token lookups cover separated compound names
+        # ("ibuprofen / famotidine") before falling back to the regex scan
+        info = None
+        for token in _TOKEN_SPLIT_RE.split(normalized_drug):
+            for key, token_info in self._name_index.get(token, ()):
+                if key in disease_keys:
+                    info = token_info
+                    break
+            if info is not None:
+                break
+        else:
+            for key in disease_keys:
+                match = self._name_patterns[key].search(normalized_drug)
+                if match:
+                    info = self.CRITICAL_CONTRAINDICATIONS[key][match.group(0)]
+                    break
+
+        self._match_memo[memo_key] = info
+        if len(self._match_memo) > self.MEMO_MAX_SIZE:
+            self._match_memo.popitem(last=False)
+        return info
+
+    def _merge_contraindications(self, disease_keys: List[str]) -> Dict[str, Dict]:
+        """Union the per-key tables into one drug -> info mapping."""
+        if len(disease_keys) == 1:
+            # Common case: one matched category, no copy needed
+            return self.CRITICAL_CONTRAINDICATIONS[disease_keys[0]]
+        # Keys arrive most-specific first; merge in reverse so entries from
+        # the most specific category win collisions
+        merged: Dict[str, Dict] = {}
+        for key in reversed(disease_keys):
+            merged.update(self.CRITICAL_CONTRAINDICATIONS[key])
+        return merged
+
+    def iter_filter_candidates(
         self,
         candidates: List[Dict],
         disease_name: str,
         remove_absolute: bool = True,
         remove_relative: bool = False
-    ) -> Tuple[List[Dict], List[Dict]]:
+    ):
         """
-        Filter drug candidates based on contraindications.
-        
+        Lazily classify drug candidates against contraindications.
+
+        Yields (candidate, status) pairs in input order, where status is
+        'safe' or 'filtered'. Candidates that gain contraindication
+        annotations are shallow-copied first, so the caller's input dicts
+        are never mutated.
+
         Args:
             candidates: List of drug candidates
             disease_name: Name of the disease being treated
             remove_absolute: Remove absolutely contraindicated drugs
             remove_relative: Remove relatively contraindicated drugs
-        
-        Returns:
-            Tuple of (safe_candidates, filtered_out_candidates)
         """
-        logger.info(f"🔍 FILTER STARTING")
-        logger.info(f"   Disease: '{disease_name}'")
-        logger.info(f"   Candidates to check: {len(candidates)}")
-        logger.info(f"   remove_absolute: {remove_absolute}")
-        logger.info(f"   remove_relative: {remove_relative}")
-        
-        # Find matching disease categories
-        disease_keys = self._find_disease_key(disease_name)
-        logger.info(f"   Matched disease categories: {disease_keys}")
-        
+        # Find matching disease categories and their merged table (memoized
+        # across batches); only per-candidate drug-name normalization stays
+        # inside the loop
+        disease_keys, contraindications = self._prepare_disease(disease_name)
+
+        # Checked once per batch: the diagnostic logs below materialize key
+        # lists, so skip them entirely when INFO is filtered out
+        info_enabled = logger.isEnabledFor(logging.INFO)
+        if info_enabled:
+            logger.info(f"   Matched disease categories: {list(disease_keys)}")
+
         if not disease_keys:
             logger.warning(f"⚠️  No contraindication data for '{disease_name}'")
-            return candidates, []
-        
-        # Collect all contraindications for this disease
-        contraindications = {}
-        for key in disease_keys:
-            contraindications.update(self.CRITICAL_CONTRAINDICATIONS[key])
-        
-        logger.info(f"   Total contraindications loaded: {len(contraindications)}")
-        logger.info(f"   Contraindicated drugs: {list(contraindications.keys())}")
-        
-        safe_candidates = []
-        filtered_out = []
-        
+            for candidate in candidates:
+                yield candidate, 'safe'
+            return
+
+        if info_enabled:
+            logger.info(f"   Total contraindications loaded: {len(contraindications)}")
+            logger.info(f"   Contraindicated drugs: {list(contraindications.keys())}")
+
+        # Bind the hot lookups once; the loop body then runs on locals
+        # instead of re-resolving attributes per candidate
+        normalize = self._normalize_name
+        match = self._match_contraindication
+
+        # Resolve the severity/flag branching once per batch; the loop then
+        # decides with a single dict probe per hit
+        should_filter_severity = {
+            'absolute': remove_absolute,
+            'relative': remove_relative,
+        }
+
         for candidate in candidates:
             drug_name = candidate.get('drug_name', '')
-            normalized_drug = self._normalize_name(drug_name)
-            
-            # Check if drug is contraindicated
-            if normalized_drug in contraindications:
-                contraindication = contraindications[normalized_drug]
+
+            # Check if drug is contraindicated (exact, then substring)
+            contraindication = match(
+                normalize(drug_name), disease_keys, contraindications
+            )
+            if contraindication is not None:
                 severity = contraindication['severity']
-                
-                # Decide whether to filter based on severity and settings
-                should_filter = False
-                if severity == 'absolute' and remove_absolute:
-                    should_filter = True
-                elif severity == 'relative' and remove_relative:
-                    should_filter = True
-                
-                if should_filter:
-                    # Add contraindication info to candidate
-                    candidate['contraindication'] = contraindication
-                    candidate['contraindication']['severity'] = severity
-                    filtered_out.append(candidate)
+
+                if should_filter_severity.get(severity, False):
+                    # Annotate a copy so the caller's dict stays untouched;
+                    # the info dict is copied too so downstream consumers
+                    # can't mutate the shared database entry
+                    candidate = {
+                        **candidate, 'contraindication': dict(contraindication)
+                    }
+                    # %-style so the string is only built when WARNING is
+                    # actually emitted
                     logger.warning(
-                        f"   ⛔ FILTERED: {drug_name} "
-                        f"(severity: {severity}, reason: {contraindication['reason']})"
+                        "   ⛔ FILTERED: %s (severity: %s, reason: %s)",
+                        drug_name, severity, contraindication['reason']
                     )
+                    yield candidate, 'filtered'
                 else:
                     # Keep the drug but add warning
-                    candidate['contraindication_warning'] = contraindication
-                    safe_candidates.append(candidate)
-                    logger.info(
-                        f"   ⚠️  KEPT WITH WARNING: {drug_name} "
-                        f"(severity: {severity})"
-                    )
+                    candidate = {
+                        **candidate,
+                        'contraindication_warning': dict(contraindication),
+                    }
+                    if info_enabled:
+                        logger.info(
+                            "   ⚠️  KEPT WITH WARNING: %s (severity: %s)",
+                            drug_name, severity
+                        )
+                    yield candidate, 'safe'
             else:
                 # Drug is safe
+                yield candidate, 'safe'
+
+    def filter_candidates(
+        self,
+        candidates: List[Dict],
+        disease_name: str,
+        remove_absolute: bool = True,
+        remove_relative: bool = False
+    ) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Filter drug candidates based on contraindications.
+
+        Plain synchronous function: the work is pure CPU-bound dict and
+        string matching, so an async wrapper would only add coroutine
+        overhead while still blocking the event loop. Thin wrapper over
+        iter_filter_candidates that materializes the two lists most
+        callers want.
+
+        Args:
+            candidates: List of drug candidates
+            disease_name: Name of the disease being treated
+            remove_absolute: Remove absolutely contraindicated drugs
+            remove_relative: Remove relatively contraindicated drugs
+
+        Returns:
+            Tuple of (safe_candidates, filtered_out_candidates)
+        """
+        logger.info(f"🔍 FILTER STARTING")
+        logger.info(f"   Disease: '{disease_name}'")
+        logger.info(f"   Candidates to check: {len(candidates)}")
+        logger.info(f"   remove_absolute: {remove_absolute}")
+        logger.info(f"   remove_relative: {remove_relative}")
+
+        safe_candidates = []
+        filtered_out = []
+        for candidate, status in self.iter_filter_candidates(
+            candidates, disease_name, remove_absolute, remove_relative
+        ):
+            if status == 'safe':
                 safe_candidates.append(candidate)
-        
+            else:
+                filtered_out.append(candidate)
+
         logger.info(f"✅ FILTER COMPLETE")
         logger.info(f"   Safe candidates: {len(safe_candidates)}")
         logger.info(f"   Filtered out: {len(filtered_out)}")
         
         return safe_candidates, filtered_out
     
+    def is_contraindicated(self, drug_name: str, disease_name: str) -> Dict:
+        """
+        Check a single drug against a single disease.
+
+        Args:
+            drug_name: Name of the drug to check
+            disease_name: Name of the disease being treated
+
+        Returns:
+            The contraindication info (severity/reason/mechanism) or None
+            if the pair is safe.
+        """
+        disease_keys, contraindications = self._prepare_disease(disease_name)
+        if not disease_keys:
+            return None
+        return self._match_contraindication(
+            self._normalize_name(drug_name), disease_keys, contraindications
+        )
+
     def get_contraindications_for_disease(self, disease_name: str) -> Dict[str, Dict]:
         """
         Get all contraindications for a specific disease.
@@ -456,13 +693,14 @@ class DrugSafetyFilter:
         Returns:
             Dictionary of contraindicated drugs with their info
         """
-        disease_keys = self._find_disease_key(disease_name)
-        
-        if not disease_keys:
-            return {}
-        
-        contraindications = {}
-        for key in disease_keys:
-            contraindications.update(self.CRITICAL_CONTRAINDICATIONS[key])
-        
-        return contraindications
\ No newline at end of file
+        # Copy on the way out: the memoized table (and, on the single-key
+        # fast path, the module-level database itself) is shared, so a
+        # caller mutating the return must not corrupt it
+        return {
+            name: dict(info)
+            for name, info in self._prepare_disease(disease_name)[1].items()
+        }
+
+# Shared instance: the database is immutable, so one filter (and its
+# memo caches) can serve every request
+DRUG_SAFETY_FILTER = DrugSafetyFilter()
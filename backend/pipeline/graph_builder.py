@@ -19,6 +19,11 @@ class ProductionGraphBuilder:
     
     def __init__(self):
         self.graph = None
+        # Per-node adjacency sets split by neighbor type, filled during
+        # build_graph so overlap queries are O(1) set intersections
+        # instead of graph traversals
+        self._gene_neighbors: Dict[str, Set[str]] = {}
+        self._pathway_neighbors: Dict[str, Set[str]] = {}
     
     def build_graph(self, disease_data: Dict, drugs_data: List[Dict]) -> nx.Graph:
         """
@@ -36,7 +41,12 @@ class ProductionGraphBuilder:
         
         # Create empty graph
         G = nx.Graph()
-        
+
+        # Reset adjacency caches for the new graph
+        self._gene_neighbors = {}
+        self._pathway_neighbors = {}
+
+
         # Add disease node
         disease_name = disease_data['name']
         G.add_node(
@@ -66,7 +76,9 @@ class ProductionGraphBuilder:
                 score=score,
                 source='OpenTargets'
             )
-        
+
+        self._gene_neighbors[disease_name] = set(disease_genes)
+
         logger.info(f"  Added {len(disease_genes)} disease-associated genes")
         
         # Add pathway nodes and disease-pathway edges
@@ -83,7 +95,9 @@ class ProductionGraphBuilder:
                 relation='involves_pathway',
                 source='curated'
             )
-        
+
+        self._pathway_neighbors[disease_name] = set(disease_pathways)
+
         logger.info(f"  Added {len(disease_pathways)} disease-associated pathways")
         
         # Add drug nodes and drug-gene-pathway edges
@@ -121,7 +135,10 @@ class ProductionGraphBuilder:
                         relation='targets',
                         source='DGIdb'
                     )
-            
+
+                self._gene_neighbors[drug_name] = set(drug_targets)
+
+
             # Add drug-pathway edges
             drug_pathways = drug.get('pathways', [])
             if drug_pathways:
@@ -139,7 +156,10 @@ class ProductionGraphBuilder:
                         relation='modulates_pathway',
                         source='inferred_from_targets'
                     )
-        
+
+                self._pathway_neighbors[drug_name] = set(drug_pathways)
+
+
         logger.info(f"  Added {len(drugs_data)} drugs")
         logger.info(f"    {drugs_with_targets} drugs with gene targets")
         logger.info(f"    {drugs_with_pathways} drugs with pathway annotations")
@@ -181,49 +201,51 @@ class ProductionGraphBuilder:
         except nx.NetworkXNoPath:
             return []
     
+    def _typed_neighbors(self, node: str, node_type: str) -> Set[str]:
+        """Neighbors of a node with the given type, computed by traversal."""
+        return {
+            neighbor
+            for neighbor in self.graph.neighbors(node)
+            if self.graph.nodes[neighbor].get('type') == node_type
+        }
+
     def get_shared_genes(self, drug_name: str, disease_name: str) -> Set[str]:
         """Get genes that are both disease-associated and drug-targeted."""
         if self.graph is None:
             return set()
-        
+
         if drug_name not in self.graph or disease_name not in self.graph:
             return set()
-        
-        # Get drug's target genes
-        drug_genes = set()
-        for neighbor in self.graph.neighbors(drug_name):
-            if self.graph.nodes[neighbor].get('type') == 'gene':
-                drug_genes.add(neighbor)
-        
-        # Get disease's associated genes
-        disease_genes = set()
-        for neighbor in self.graph.neighbors(disease_name):
-            if self.graph.nodes[neighbor].get('type') == 'gene':
-                disease_genes.add(neighbor)
-        
+
+        # Use the adjacency sets cached at build time; fall back to a
+        # traversal only for nodes the cache doesn't know about
+        drug_genes = self._gene_neighbors.get(drug_name)
+        if drug_genes is None:
+            drug_genes = self._typed_neighbors(drug_name, 'gene')
+
+        disease_genes = self._gene_neighbors.get(disease_name)
+        if disease_genes is None:
+            disease_genes = self._typed_neighbors(disease_name, 'gene')
+
         # Return intersection
         return drug_genes & disease_genes
-    
+
     def get_shared_pathways(self, drug_name: str, disease_name: str) -> Set[str]:
         """Get pathways that are both disease-relevant and drug-modulated."""
         if self.graph is None:
             return set()
-        
+
         if drug_name not in self.graph or disease_name not in self.graph:
             return set()
-        
-        # Get drug's pathways
-        drug_pathways = set()
-        for neighbor in self.graph.neighbors(drug_name):
-            if self.graph.nodes[neighbor].get('type') == 'pathway':
-                drug_pathways.add(neighbor)
-        
-        # Get disease's pathways
-        disease_pathways = set()
-        for neighbor in self.graph.neighbors(disease_name):
-            if self.graph.nodes[neighbor].get('type') == 'pathway':
-                disease_pathways.add(neighbor)
-        
+
+        drug_pathways = self._pathway_neighbors.get(drug_name)
+        if drug_pathways is None:
+            drug_pathways = self._typed_neighbors(drug_name, 'pathway')
+
+        disease_pathways = self._pathway_neighbors.get(disease_name)
+        if disease_pathways is None:
+            disease_pathways = self._typed_neighbors(disease_name, 'pathway')
+
         # Return intersection
         return drug_pathways & disease_pathways
     
@@ -6,6 +6,7 @@ Uses real public databases (OpenTargets, ChEMBL, DGIdb)
 
 import asyncio
 import logging
+from collections import OrderedDict
 from typing import Dict, List, Optional
 import time
 
@@ -23,14 +24,21 @@ class ProductionPipeline:
     Integrates multiple public databases and scoring algorithms.
     """
     
+    # Bounded LRU size for memoized analysis results
+    RESULT_CACHE_SIZE = 256
+
     def __init__(self):
         self.data_fetcher = ProductionDataFetcher()
         self.graph_builder = ProductionGraphBuilder()
         self.scorer = None
-        
+
         # Cache for repeated queries
         self.disease_cache = {}
         self.drugs_cache = None
+
+        # LRU cache of full analysis results keyed on the normalized query,
+        # so repeated identical requests skip the multi-API pipeline
+        self.result_cache: OrderedDict = OrderedDict()
     
     async def analyze_disease(
         self,
@@ -49,8 +57,15 @@ class ProductionPipeline:
         Returns:
             Dictionary with candidates and analysis metadata
         """
+        cache_key = (disease_name.strip().lower(), min_score, max_results)
+        cached = self.result_cache.get(cache_key)
+        if cached is not None:
+            self.result_cache.move_to_end(cache_key)
+            logger.info(f"✅ Using cached analysis for '{disease_name}'")
+            return cached
+
         start_time = time.time()
-        
+
         logger.info("="*70)
         logger.info(f"🔬 STARTING ANALYSIS: {disease_name}")
         logger.info("="*70)
@@ -93,16 +108,21 @@ class ProductionPipeline:
         # STEP 4: Score all drugs
         logger.info("\n🎯 Step 4/5: Scoring drug-disease matches...")
         self.scorer = ProductionScorer(graph)
-        
+
+        # Run the whole vectorized sweep in a worker thread so the event
+        # loop stays responsive while scoring. A process pool would not
+        # help here: the scorer (graph + sparse matrices) is not picklable
+        # and the numpy kernel releases the GIL anyway
+        scored = await asyncio.to_thread(
+            self.scorer.score_batch,
+            drugs_data,
+            disease_data['name'],
+            disease_data,
+            min_score
+        )
+
         candidates = []
-        for drug in drugs_data:
-            score, evidence = self.scorer.score_drug_disease_match(
-                drug['name'],
-                disease_data['name'],
-                disease_data,
-                drug
-            )
-            
+        for drug, score, evidence in scored:
             if score >= min_score:
                 candidates.append({
                     'drug_name': drug['name'],
@@ -176,7 +196,12 @@ class ProductionPipeline:
                 logger.info(f"     Score: {candidate['score']:.3f} ({candidate['confidence']} confidence)")
                 logger.info(f"     Shared genes: {len(candidate['shared_genes'])}")
                 logger.info(f"     Shared pathways: {len(candidate['shared_pathways'])}")
-        
+
+        # Memoize successful analyses, evicting the least recently used entry
+        self.result_cache[cache_key] = result
+        if len(self.result_cache) > self.RESULT_CACHE_SIZE:
+            self.result_cache.popitem(last=False)
+
         return result
     
     async def close(self):
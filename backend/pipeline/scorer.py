@@ -4,13 +4,51 @@ Better confidence thresholds and more sensitive scoring
 """
 
 import logging
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 import networkx as nx
+import numpy as np
+from scipy import sparse
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Known successful repurposing cases, grouped by disease keyword so the
+# per-drug literature check only scans the handful of drugs relevant to
+# the disease being scored instead of the full cross-product
+_KNOWN_REPURPOSING_CASES: Dict[str, Dict[str, float]] = {
+    'parkinson': {
+        'nilotinib': 0.8,
+        'ambroxol': 0.7,
+        'exenatide': 0.7,
+        'imatinib': 0.6,
+        'rasagiline': 0.75,
+        'selegiline': 0.7,
+        'apomorphine': 0.9,  # Actually approved for Parkinson's
+    },
+    'huntington': {
+        'pridopidine': 0.7,
+        'tetrabenazine': 0.9,
+    },
+    'als': {
+        'riluzole': 0.95,
+        'edaravone': 0.9,
+    },
+    'alzheimer': {
+        'donepezil': 0.95,
+        'memantine': 0.95,
+    },
+    'gaucher': {
+        'imiglucerase': 0.95,
+        'eliglustat': 0.9,
+    },
+    'wilson': {
+        'penicillamine': 0.95,
+        'trientine': 0.9,
+    },
+}
+
+
 class ProductionScorer:
     """
     IMPROVED: Better confidence levels and scoring for real drug repurposing.
@@ -60,7 +98,158 @@ class ProductionScorer:
     
     def __init__(self, graph: nx.Graph):
         self.graph = graph
-    
+
+        # Sparse drug-membership index, rebuilt lazily when a new drug
+        # list is scored (see _ensure_drug_index). Stored as one tuple so
+        # concurrent score_batch calls from worker threads each operate on
+        # a consistent snapshot
+        self._drug_index: Optional[Tuple] = None
+
+    def _ensure_drug_index(self, drugs: List[Dict]) -> Tuple:
+        """Build drugs x genes / drugs x pathways membership matrices once."""
+        # The cached tuple holds the drugs list itself, so the identity
+        # check is sound: pinning the list means its id can't be recycled
+        # for a different list while the index is alive
+        cached = self._drug_index
+        if cached is not None and cached[0] is drugs:
+            return cached
+
+        gene_vocab: Dict[str, int] = {}
+        pathway_vocab: Dict[str, int] = {}
+        gene_rows, gene_cols = [], []
+        pathway_rows, pathway_cols = [], []
+
+        # Dedup per row: DGIdb emits one interaction record per claim, so
+        # a drug's targets list can repeat a gene, and csr_matrix sums
+        # duplicate entries — which would double-count that gene's weight
+        for row, drug in enumerate(drugs):
+            for gene in set(drug.get('targets') or ()):
+                gene_rows.append(row)
+                gene_cols.append(gene_vocab.setdefault(gene, len(gene_vocab)))
+            for pathway in set(drug.get('pathways') or ()):
+                pathway_rows.append(row)
+                pathway_cols.append(pathway_vocab.setdefault(pathway, len(pathway_vocab)))
+
+        n_drugs = len(drugs)
+        gene_matrix = sparse.csr_matrix(
+            (np.ones(len(gene_rows), dtype=np.int8), (gene_rows, gene_cols)),
+            shape=(n_drugs, max(len(gene_vocab), 1))
+        )
+        pathway_matrix = sparse.csr_matrix(
+            (np.ones(len(pathway_rows), dtype=np.int8), (pathway_rows, pathway_cols)),
+            shape=(n_drugs, max(len(pathway_vocab), 1))
+        )
+        index = (drugs, gene_vocab, pathway_vocab, gene_matrix, pathway_matrix)
+        self._drug_index = index
+        return index
+
+    @staticmethod
+    def _shared_counts(
+        index: Tuple,
+        disease_gene_set: frozenset,
+        disease_pathway_set: frozenset,
+        gene_scores: Dict[str, float]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Shared gene/pathway counts plus association-weighted gene sums for
+        every indexed drug, computed with three sparse matvecs.
+        """
+        _, gene_vocab, pathway_vocab, gene_matrix, pathway_matrix = index
+
+        gene_mask = np.zeros(gene_matrix.shape[1], dtype=np.int32)
+        gene_weights = np.zeros(gene_matrix.shape[1], dtype=np.float32)
+        for gene in disease_gene_set:
+            idx = gene_vocab.get(gene)
+            if idx is not None:
+                gene_mask[idx] = 1
+                gene_weights[idx] = gene_scores.get(gene, 0.5)
+
+        pathway_mask = np.zeros(pathway_matrix.shape[1], dtype=np.int32)
+        for pathway in disease_pathway_set:
+            idx = pathway_vocab.get(pathway)
+            if idx is not None:
+                pathway_mask[idx] = 1
+
+        return (
+            gene_matrix.dot(gene_mask),
+            pathway_matrix.dot(pathway_mask),
+            gene_matrix.dot(gene_weights),
+        )
+
+    # Maximum total score reachable by a drug with zero gene and pathway
+    # overlap: mechanism (0.10 weighted) + literature (0.05 * 0.95) +
+    # rare-disease bonus (0.03), rounded up
+    NO_OVERLAP_MAX_SCORE = 0.18
+
+    def score_batch(
+        self,
+        drugs: List[Dict],
+        disease_name: str,
+        disease_data: Dict,
+        min_score: Optional[float] = None
+    ) -> List[Tuple[Dict, float, Dict]]:
+        """
+        Score a batch of drugs against one disease in a single pass.
+
+        Precomputes the disease-side gene/pathway sets once instead of
+        re-resolving them for every drug, so scoring N drugs costs N set
+        intersections instead of N graph traversals.
+
+        When min_score is given and lies above NO_OVERLAP_MAX_SCORE,
+        drugs with zero overlap are dropped before detailed scoring since
+        they cannot reach the threshold.
+
+        Returns:
+            List of (drug, score, evidence) tuples, one per surviving drug
+        """
+        # Hoist the disease-side collections into frozensets once for the
+        # whole batch - intersections are then O(targets) per drug
+        disease_gene_set = frozenset(disease_data.get('genes', []))
+        disease_pathway_set = frozenset(disease_data.get('pathways', []))
+
+        # Vectorized overlap counts: one sparse matvec per evidence type
+        # instead of two Python set intersections per drug
+        index = self._ensure_drug_index(drugs)
+        gene_counts, pathway_counts, weighted_gene_sums = self._shared_counts(
+            index, disease_gene_set, disease_pathway_set,
+            disease_data.get('gene_scores', {})
+        )
+
+        # Selectivity prefilter: with a high enough threshold, zero-overlap
+        # drugs cannot qualify, so skip their detailed scoring entirely
+        skip_no_overlap = (
+            min_score is not None and min_score > self.NO_OVERLAP_MAX_SCORE
+        )
+
+        empty = frozenset()
+        results = []
+        # Bind hot attributes locally - saves two attribute lookups per drug
+        score_single = self._score_single
+        add_result = results.append
+        for i, drug in enumerate(drugs):
+            if gene_counts[i] or pathway_counts[i]:
+                gene_set, pathway_set = disease_gene_set, disease_pathway_set
+                weighted_sum = float(weighted_gene_sums[i])
+            elif skip_no_overlap:
+                continue
+            else:
+                # No overlap: empty disease sets short-circuit the
+                # intersection scorers while keeping the same evidence shape
+                gene_set, pathway_set = empty, empty
+                weighted_sum = 0.0
+
+            score, evidence = score_single(
+                drug['name'],
+                disease_name,
+                disease_data,
+                drug,
+                gene_set,
+                pathway_set,
+                weighted_gene_sum=weighted_sum
+            )
+            add_result((drug, score, evidence))
+        return results
+
     def score_drug_disease_match(
         self,
         drug_name: str,
@@ -70,10 +259,30 @@ class ProductionScorer:
     ) -> Tuple[float, Dict]:
         """
         Score drug-disease match with improved sensitivity.
-        
+
         Returns:
             (score, evidence_dict) where score is 0-1
         """
+        return self._score_single(
+            drug_name,
+            disease_name,
+            disease_data,
+            drug_data,
+            frozenset(disease_data.get('genes', [])),
+            frozenset(disease_data.get('pathways', []))
+        )
+
+    def _score_single(
+        self,
+        drug_name: str,
+        disease_name: str,
+        disease_data: Dict,
+        drug_data: Dict,
+        disease_gene_set: frozenset,
+        disease_pathway_set: frozenset,
+        weighted_gene_sum: Optional[float] = None
+    ) -> Tuple[float, Dict]:
+        """Score one drug against precomputed disease gene/pathway sets."""
         evidence = {
             'shared_genes': [],
             'shared_pathways': [],
@@ -90,28 +299,25 @@ class ProductionScorer:
         drug_targets = drug_data.get('targets', [])
         drug_pathways = drug_data.get('pathways', [])
         
-        # Get disease genes and pathways
-        disease_genes = disease_data.get('genes', [])
-        disease_pathways = disease_data.get('pathways', [])
-        
         # Early exit if no data
         if not drug_targets and not drug_pathways:
             logger.debug(f"Skipping {drug_name}: no targets or pathways")
             return 0.0, evidence
-        
+
         # 1. GENE TARGETING SCORE (50% weight) - INCREASED
         gene_score, shared_genes = self._score_gene_overlap_improved(
             drug_targets,
-            disease_genes,
-            disease_data.get('gene_scores', {})
+            disease_gene_set,
+            disease_data.get('gene_scores', {}),
+            weighted_sum=weighted_gene_sum
         )
         evidence['gene_score'] = gene_score
         evidence['shared_genes'] = list(shared_genes)
-        
+
         # 2. PATHWAY OVERLAP SCORE (35% weight)
         pathway_score, shared_pathways = self._score_pathway_overlap_improved(
             drug_pathways,
-            disease_pathways
+            disease_pathway_set
         )
         evidence['pathway_score'] = pathway_score
         evidence['shared_pathways'] = list(shared_pathways)
@@ -161,27 +367,30 @@ class ProductionScorer:
     def _score_gene_overlap_improved(
         self,
         drug_targets: List[str],
-        disease_genes: List[str],
-        gene_scores: Dict[str, float]
+        disease_genes: Set[str],
+        gene_scores: Dict[str, float],
+        weighted_sum: Optional[float] = None
     ) -> Tuple[float, Set[str]]:
         """
         More lenient gene scoring with better normalization.
         """
         if not drug_targets or not disease_genes:
             return 0.0, set()
-        
-        drug_set = set(drug_targets)
-        disease_set = set(disease_genes)
-        shared = drug_set & disease_set
-        
+
+        shared = disease_genes.intersection(drug_targets)
+
         if not shared:
             return 0.0, set()
-        
-        # Weight by gene association scores from OpenTargets
-        weighted_score = 0.0
-        for gene in shared:
-            association_score = gene_scores.get(gene, 0.5)
-            weighted_score += association_score
+
+        # Weight by gene association scores from OpenTargets; score_batch
+        # passes the precomputed sparse-matvec sum for the whole batch
+        if weighted_sum is not None:
+            weighted_score = weighted_sum
+        else:
+            weighted_score = 0.0
+            for gene in shared:
+                association_score = gene_scores.get(gene, 0.5)
+                weighted_score += association_score
         
         # IMPROVED: Better normalization
         # Use min(disease_genes, 50) to prevent dilution for well-studied diseases
@@ -207,18 +416,16 @@ class ProductionScorer:
     def _score_pathway_overlap_improved(
         self,
         drug_pathways: List[str],
-        disease_pathways: List[str]
+        disease_pathways: Set[str]
     ) -> Tuple[float, Set[str]]:
         """
         More lenient pathway scoring.
         """
         if not drug_pathways or not disease_pathways:
             return 0.0, set()
-        
-        drug_set = set(drug_pathways)
-        disease_set = set(disease_pathways)
-        shared = drug_set & disease_set
-        
+
+        shared = disease_pathways.intersection(drug_pathways)
+
         if not shared:
             return 0.0, set()
         
@@ -311,47 +518,24 @@ class ProductionScorer:
         disease_data: Dict
     ) -> float:
         """Score based on known repurposing cases."""
-        
-        # Known successful repurposing cases
-        known_cases = {
-            # Parkinson's disease
-            ('nilotinib', 'parkinson'): 0.8,
-            ('ambroxol', 'parkinson'): 0.7,
-            ('exenatide', 'parkinson'): 0.7,
-            ('imatinib', 'parkinson'): 0.6,
-            ('rasagiline', 'parkinson'): 0.75,
-            ('selegiline', 'parkinson'): 0.7,
-            ('apomorphine', 'parkinson'): 0.9,  # Actually approved for Parkinson's
-            
-            # Huntington's disease
-            ('pridopidine', 'huntington'): 0.7,
-            ('tetrabenazine', 'huntington'): 0.9,
-            
-            # ALS
-            ('riluzole', 'als'): 0.95,
-            ('edaravone', 'als'): 0.9,
-            
-            # Alzheimer's
-            ('donepezil', 'alzheimer'): 0.95,
-            ('memantine', 'alzheimer'): 0.95,
-            
-            # Gaucher disease
-            ('imiglucerase', 'gaucher'): 0.95,
-            ('eliglustat', 'gaucher'): 0.9,
-            
-            # Wilson disease
-            ('penicillamine', 'wilson'): 0.95,
-            ('trientine', 'wilson'): 0.9,
-        }
-        
         drug_lower = drug_name.lower()
         disease_lower = disease_name.lower()
-        
-        for (known_drug, known_disease), score in known_cases.items():
-            if known_drug in drug_lower and known_disease in disease_lower:
+
+        # Only drugs under matching disease keywords are scanned; a drug
+        # name still matches by substring to tolerate salt suffixes
+        for known_disease, cases in _KNOWN_REPURPOSING_CASES.items():
+            if known_disease not in disease_lower:
+                continue
+            score = cases.get(drug_lower)
+            if score is None:
+                for known_drug, case_score in cases.items():
+                    if known_drug in drug_lower:
+                        score = case_score
+                        break
+            if score is not None:
                 logger.info(f"✨ Known repurposing case: {drug_name} for {disease_name}")
                 return score
-        
+
         return 0.0
     
     def _apply_bonuses(